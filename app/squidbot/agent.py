@@ -249,6 +249,10 @@ async def run_agent_with_history(
 
     Returns:
         Tuple of (response, updated_history)
+
+    The passed-in list is mutated in place (appended and trimmed), so
+    callers holding a reference to it see the new turns without
+    reassignment.
     """
     response = await run_agent(user_message, session_history)
 
@@ -256,8 +260,9 @@ async def run_agent_with_history(
     session_history.append({"role": "user", "content": user_message})
     session_history.append({"role": "assistant", "content": response})
 
-    # Keep history manageable (last 20 exchanges)
+    # Keep history manageable (last 20 exchanges); trim in place so the
+    # caller's list object survives long sessions without O(N) copies
     if len(session_history) > 40:
-        session_history = session_history[-40:]
+        del session_history[:-40]
 
     return response, session_history
@@ -0,0 +1,84 @@
+"""Response cache - short-circuit repeated user messages before the LLM."""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+# Cache sizing/expiry defaults
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL_SECONDS = 300.0
+
+
+class ResponseCache:
+    """Exact-match LRU cache for agent responses.
+
+    Keyed on the chat scope, the normalized user message, and the tail
+    of the conversation history, so the same question in a different
+    context does not hit. Entries expire after a TTL because agent
+    answers can depend on tool output (web search, time) that goes
+    stale.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = CACHE_MAX_ENTRIES,
+        ttl: float = CACHE_TTL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(
+        self, scope: object, message: str, history: list[dict] | None = None
+    ) -> bytes:
+        """Build a cache key; call before the agent mutates the history."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(scope).encode())
+        h.update(b"\x00")
+        h.update(message.strip().lower().encode())
+        for turn in (history or [])[-2:]:
+            h.update(b"\x00")
+            h.update(turn.get("content", "").encode())
+        return h.digest()
+
+    def get(self, key: bytes) -> str | None:
+        """Return the cached response for a key, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key: bytes, response: str) -> None:
+        """Store a response, evicting the least recently used if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+# Global response cache instance
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global response cache instance."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
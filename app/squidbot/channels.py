@@ -116,6 +116,11 @@ class TelegramAdapter(ChannelAdapter):
             logger.warning(f"Failed to send typing indicator: {e}")
 
 
+def frame_message(payload: bytes) -> bytes:
+    """Wrap a payload in the 4-byte big-endian length-prefixed TCP frame."""
+    return len(payload).to_bytes(4, "big") + payload
+
+
 class TCPAdapter(ChannelAdapter):
     """TCP client channel adapter."""
 
@@ -140,8 +145,10 @@ class TCPAdapter(ChannelAdapter):
 
         try:
             notification = {"status": "notification", "response": payload.text}
-            data = json.dumps(notification) + "\n"
-            writer.write(data.encode())
+            # writelines hands both parts to the transport without an
+            # intermediate concatenated copy
+            body = json.dumps(notification).encode()
+            writer.writelines((len(body).to_bytes(4, "big"), body))
             await writer.drain()
             return True
         except Exception as e:
@@ -1,10 +1,9 @@
 """AI Character/Personality configuration."""
 
+import asyncio
 import os
 from pathlib import Path
 
-import aiofiles
-
 from .config import DATA_DIR
 
 # Character configuration from environment
@@ -18,17 +17,32 @@ CHARACTER_FILE = DATA_DIR / "CHARACTER.md"
 
 async def load_character_file() -> str:
     """Load character definition from file if exists."""
-    if CHARACTER_FILE.exists():
-        try:
-            async with aiofiles.open(CHARACTER_FILE, "r", encoding="utf-8") as f:
-                return await f.read()
-        except Exception:
-            pass
-    return ""
+    # Just attempt the read: the prompt cache below already keys on the
+    # file's mtime, so this only runs on a miss, and a separate
+    # existence memo could go stale when the file appears at runtime
+    try:
+        # One thread hop for open+read+close beats per-call dispatch
+        return await asyncio.to_thread(CHARACTER_FILE.read_text, encoding="utf-8")
+    except OSError:
+        return ""
+
+
+# Assembled prompt keyed by CHARACTER_FILE mtime plus the env-derived
+# settings (overridable in tests)
+_char_cache: tuple[tuple, str] | None = None
 
 
 async def get_character_prompt() -> str:
     """Build character prompt section."""
+    global _char_cache
+    try:
+        mtime = CHARACTER_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    key = (mtime, CHARACTER_NAME, CHARACTER_PERSONA, CHARACTER_STYLE)
+    if _char_cache is not None and _char_cache[0] == key:
+        return _char_cache[1]
+
     parts = []
 
     # Name
@@ -48,10 +62,9 @@ async def get_character_prompt() -> str:
     if file_content:
         parts.append(file_content)
 
-    if not parts:
-        return ""
-
-    return "## Character\n" + "\n".join(parts)
+    prompt = "## Character\n" + "\n".join(parts) if parts else ""
+    _char_cache = (key, prompt)
+    return prompt
 
 
 async def create_example_character():
@@ -79,5 +92,4 @@ You are a helpful AI assistant with the following traits:
 - Problem solving
 """
     CHARACTER_FILE.parent.mkdir(parents=True, exist_ok=True)
-    async with aiofiles.open(CHARACTER_FILE, "w") as f:
-        await f.write(example)
+    await asyncio.to_thread(CHARACTER_FILE.write_text, example, encoding="utf-8")
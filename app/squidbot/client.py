@@ -7,15 +7,28 @@ Features: async operations, input history, loading animation, notifications.
 """
 
 import asyncio
-import json
+import os
 import readline
 import signal
+import socket
 import sys
 import time
+from itertools import cycle
 from pathlib import Path
 
+import orjson
+
 from .config import DATA_DIR, SQUID_PORT
 
+# libuv event loop: faster socket reads and fewer write syscalls for the
+# small JSON lines this client exchanges (unavailable on Windows)
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 # Server configuration
 SERVER_HOST = "127.0.0.1"
 SERVER_PORT = SQUID_PORT
@@ -23,6 +36,10 @@ SERVER_PORT = SQUID_PORT
 # History file
 HISTORY_FILE = DATA_DIR / "client_history"
 
+# Preserialized fixed-payload requests (ping on connect, /clear command)
+_PING_BYTES = b'{"command":"ping","message":""}\n'
+_CLEAR_BYTES = b'{"command":"clear","message":""}\n'
+
 
 class Spinner:
     """Animated spinner for loading indication with elapsed time."""
@@ -38,14 +55,18 @@ class Spinner:
 
     async def _animate(self):
         """Run the animation loop."""
-        idx = 0
+        frames = cycle(self.FRAMES)
+        start = time.monotonic()
+        last_tenths = -1
+        write = sys.stdout.write
         while self.running:
-            frame = self.FRAMES[idx % len(self.FRAMES)]
-            self.elapsed = time.time() - self.start_time
-            print(
-                f"\r{frame} {self.message}... ({self.elapsed:.1f}s)", end="", flush=True
-            )
-            idx += 1
+            # Only redraw when the displayed tenths-of-a-second changes
+            tenths = int((time.monotonic() - start) * 10)
+            if tenths != last_tenths:
+                self.elapsed = tenths / 10
+                write(f"\r{next(frames)} {self.message}... ({self.elapsed:.1f}s)")
+                sys.stdout.flush()
+                last_tenths = tenths
             await asyncio.sleep(0.1)
 
     async def start(self):
@@ -123,6 +144,12 @@ class SquidBotClient:
             self.reader, self.writer = await asyncio.open_connection(
                 SERVER_HOST, SERVER_PORT
             )
+            # Disable Nagle so small JSON requests go out immediately,
+            # and keep long-idle sessions from going stale
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             return True
         except ConnectionRefusedError:
             print(f"Error: Cannot connect to server at {SERVER_HOST}:{SERVER_PORT}")
@@ -138,22 +165,29 @@ class SquidBotClient:
         if not self.writer:
             return
 
-        request = {"command": command, "message": message}
-        data = json.dumps(request) + "\n"
-        self.writer.write(data.encode())
+        # Fixed payloads skip the dict build and serialization entirely
+        if command == "ping" and not message:
+            self.writer.write(_PING_BYTES)
+        elif command == "clear" and not message:
+            self.writer.write(_CLEAR_BYTES)
+        else:
+            # orjson emits bytes directly: no str intermediate, no .encode()
+            request = {"command": command, "message": message}
+            self.writer.write(orjson.dumps(request) + b"\n")
         await self.writer.drain()
 
     async def read_responses(self):
         """Single reader task that dispatches responses to the right handler."""
         while self.running and self.reader:
             try:
-                data = await self.reader.readline()
-                if not data:
-                    # Connection closed
-                    await self.response_queue.put(None)
-                    break
+                # Length-prefixed frames: two readexactly calls instead
+                # of a byte-by-byte newline scan over the payload
+                header = await self.reader.readexactly(4)
+                payload = await self.reader.readexactly(
+                    int.from_bytes(header, "big")
+                )
 
-                response = json.loads(data.decode().strip())
+                response = orjson.loads(payload)
 
                 if response.get("status") == "notification":
                     # Handle notification immediately
@@ -166,7 +200,11 @@ class SquidBotClient:
 
             except asyncio.CancelledError:
                 break
-            except json.JSONDecodeError:
+            except asyncio.IncompleteReadError:
+                # Connection closed
+                await self.response_queue.put(None)
+                break
+            except orjson.JSONDecodeError:
                 continue
             except Exception:
                 await self.response_queue.put(None)
@@ -211,6 +249,32 @@ class SquidBotClient:
     async def get_input(self, prompt: str) -> str:
         """Get user input asynchronously."""
         loop = asyncio.get_event_loop()
+
+        # On a POSIX TTY, wait for stdin with the event loop instead of
+        # parking an executor thread on input() for the whole prompt;
+        # notifications and signals interleave immediately
+        if os.name == "posix" and sys.stdin.isatty():
+            fd = sys.stdin.fileno()
+            fut = loop.create_future()
+
+            def _on_readable():
+                loop.remove_reader(fd)
+                line = sys.stdin.readline()
+                if fut.done():
+                    return
+                if line:
+                    fut.set_result(line.rstrip("\n"))
+                else:
+                    fut.set_exception(EOFError())
+
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            loop.add_reader(fd, _on_readable)
+            try:
+                return await fut
+            finally:
+                loop.remove_reader(fd)
+
         return await loop.run_in_executor(None, lambda: input(prompt))
 
     async def run(self):
@@ -20,9 +20,18 @@ from telegram.ext import (Application, CommandHandler, ContextTypes,
                           MessageHandler, filters)
 
 from .agent import run_agent_with_history
+from .cache import get_response_cache
 from .config import TELEGRAM_BOT_TOKEN, validate_config
 from .scheduler import Scheduler
 
+# libuv event loop for the polling/agent loops (unavailable on Windows)
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 # Setup logging
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
@@ -65,34 +74,44 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     global scheduler
     if scheduler:
         scheduler.set_chat_id(chat_id)
+        scheduler.record_activity()
 
     # Get or create session history
-    if chat_id not in sessions:
-        sessions[chat_id] = []
+    history = sessions.setdefault(chat_id, [])
+
+    # Repeated message in the same context? Skip the LLM round-trip
+    cache = get_response_cache()
+    cache_key = cache.key_for(chat_id, user_message, history)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        await update.message.reply_text(cached)
+        return
 
     # Send typing indicator
     await context.bot.send_chat_action(chat_id=chat_id, action="typing")
 
     try:
-        # Run the agent
-        response, updated_history = await run_agent_with_history(
-            user_message, sessions[chat_id]
-        )
-        sessions[chat_id] = updated_history
+        # Run the agent; history is appended/trimmed in place
+        response, _ = await run_agent_with_history(user_message, history)
+        cache.put(cache_key, response)
 
         # Send response (split if too long)
         max_length = 4096
         if len(response) <= max_length:
             await update.message.reply_text(response)
         else:
-            # Split into chunks
-            for i in range(0, len(response), max_length):
-                chunk = response[i : i + max_length]
-                await update.message.reply_text(chunk)
-
-        # Reload scheduler jobs in case new ones were created
+            # Fire all chunks concurrently: one round-trip of latency
+            # instead of one per chunk (Telegram sequences per chat)
+            await asyncio.gather(
+                *(
+                    update.message.reply_text(response[i : i + max_length])
+                    for i in range(0, len(response), max_length)
+                )
+            )
+
+        # Reload scheduler jobs only if a tool changed them
         if scheduler:
-            scheduler.reload_jobs()
+            scheduler.reload_if_dirty()
 
     except Exception as e:
         logger.exception("Error handling message")
@@ -39,6 +39,7 @@ class PluginApi:
         hook_name: "HookName",
         handler: Callable[..., Awaitable[Any] | Any],
         priority: int = 0,
+        match: Callable[[Any], bool] | set[str] | frozenset[str] | None = None,
     ) -> None:
         """Register a hook handler.
 
@@ -46,12 +47,16 @@ class PluginApi:
             hook_name: The hook to listen for
             handler: Async or sync function(event, context) -> result
             priority: Higher priority handlers run first (default: 0)
+            match: Optional filter - a predicate on the event, or a set
+                of tool names for tool hooks; non-matching events never
+                reach the handler
         """
         self._hook_registry.register(
             plugin_id=self._plugin_id,
             hook_name=hook_name,
             handler=handler,
             priority=priority,
+            match=match,
         )
 
 
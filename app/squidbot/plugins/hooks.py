@@ -8,31 +8,40 @@ Inspired by OpenClaw's hook architecture.
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
 
-class HookName(str, Enum):
-    """Available hook types."""
+class HookName(IntEnum):
+    """Available hook types.
+
+    Integer-valued so the registry can index a flat list instead of
+    hashing a string per dispatch; use `.label` for the wire name.
+    """
 
     # Agent lifecycle hooks
-    BEFORE_AGENT_START = "before_agent_start"
-    AGENT_END = "agent_end"
+    BEFORE_AGENT_START = 0
+    AGENT_END = 1
 
     # Message hooks
-    MESSAGE_RECEIVED = "message_received"
-    MESSAGE_SENDING = "message_sending"
-    MESSAGE_SENT = "message_sent"
+    MESSAGE_RECEIVED = 2
+    MESSAGE_SENDING = 3
+    MESSAGE_SENT = 4
 
     # Tool hooks
-    BEFORE_TOOL_CALL = "before_tool_call"
-    AFTER_TOOL_CALL = "after_tool_call"
+    BEFORE_TOOL_CALL = 5
+    AFTER_TOOL_CALL = 6
 
     # Session hooks
-    SESSION_START = "session_start"
-    SESSION_END = "session_end"
+    SESSION_START = 7
+    SESSION_END = 8
+
+    @property
+    def label(self) -> str:
+        """Human-readable hook name, e.g. "before_tool_call"."""
+        return self.name.lower()
 
 
 # ============================================================
@@ -40,7 +49,7 @@ class HookName(str, Enum):
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class BeforeAgentStartEvent:
     """Event for before_agent_start hook."""
 
@@ -49,7 +58,7 @@ class BeforeAgentStartEvent:
     session_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BeforeAgentStartResult:
     """Result from before_agent_start hook."""
 
@@ -57,7 +66,7 @@ class BeforeAgentStartResult:
     prepend_context: str | None = None  # Prepend to context
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEndEvent:
     """Event for agent_end hook."""
 
@@ -68,7 +77,7 @@ class AgentEndEvent:
     duration_ms: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageReceivedEvent:
     """Event for message_received hook."""
 
@@ -78,7 +87,7 @@ class MessageReceivedEvent:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageSendingEvent:
     """Event for message_sending hook."""
 
@@ -88,7 +97,7 @@ class MessageSendingEvent:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageSendingResult:
     """Result from message_sending hook."""
 
@@ -96,7 +105,7 @@ class MessageSendingResult:
     cancel: bool = False  # Prevent sending
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageSentEvent:
     """Event for message_sent hook."""
 
@@ -107,7 +116,7 @@ class MessageSentEvent:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BeforeToolCallEvent:
     """Event for before_tool_call hook."""
 
@@ -115,7 +124,7 @@ class BeforeToolCallEvent:
     params: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BeforeToolCallResult:
     """Result from before_tool_call hook."""
 
@@ -124,7 +133,7 @@ class BeforeToolCallResult:
     block_reason: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AfterToolCallEvent:
     """Event for after_tool_call hook."""
 
@@ -135,7 +144,7 @@ class AfterToolCallEvent:
     duration_ms: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStartEvent:
     """Event for session_start hook."""
 
@@ -144,7 +153,7 @@ class SessionStartEvent:
     user_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionEndEvent:
     """Event for session_end hook."""
 
@@ -153,7 +162,7 @@ class SessionEndEvent:
     duration_ms: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HookContext:
     """Context passed to all hooks."""
 
@@ -168,7 +177,7 @@ class HookContext:
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class HookRegistration:
     """A registered hook handler."""
 
@@ -176,13 +185,22 @@ class HookRegistration:
     hook_name: HookName
     handler: Callable[..., Awaitable[Any] | Any]
     priority: int = 0  # Higher = runs first
+    is_async: bool = False  # Precomputed at registration
+    match: Callable[[Any], bool] | None = None  # Pre-filter on the event
 
 
 class HookRegistry:
     """Registry for all hook handlers."""
 
     def __init__(self):
-        self._hooks: list[HookRegistration] = []
+        # Hooks are registered rarely but fired constantly, so keep them
+        # pre-shaped for dispatch: a flat list indexed by the IntEnum
+        # value (no string hashing) holding immutable tuples sorted by
+        # priority, swapped atomically on register/unregister so dispatch
+        # iterates without locks or copies; plus a per-plugin index for
+        # O(1) unregister
+        self._by_name: list[tuple[HookRegistration, ...]] = [() for _ in HookName]
+        self._by_plugin: dict[str, list[HookRegistration]] = {}
 
     def register(
         self,
@@ -190,51 +208,78 @@ class HookRegistry:
         hook_name: HookName,
         handler: Callable,
         priority: int = 0,
+        match: Callable[[Any], bool] | set[str] | frozenset[str] | None = None,
     ) -> None:
-        """Register a hook handler."""
-        self._hooks.append(
-            HookRegistration(
-                plugin_id=plugin_id,
-                hook_name=hook_name,
-                handler=handler,
-                priority=priority,
-            )
+        """Register a hook handler.
+
+        `match` restricts when the handler fires: a predicate on the
+        event, or a set of tool names for tool hooks. Non-matching
+        events skip the handler entirely in the runner.
+        """
+        if match is not None and not callable(match):
+            names = frozenset(match)
+            match = lambda event: getattr(event, "tool_name", None) in names
+        reg = HookRegistration(
+            plugin_id=plugin_id,
+            hook_name=hook_name,
+            handler=handler,
+            priority=priority,
+            is_async=asyncio.iscoroutinefunction(handler),
+            match=match,
         )
+        old = self._by_name[hook_name]
+        self._by_name[hook_name] = tuple(
+            sorted(old + (reg,), key=lambda r: r.priority, reverse=True)
+        )
+        self._by_plugin.setdefault(plugin_id, []).append(reg)
         logger.debug(
-            f"Registered hook {hook_name.value} from plugin {plugin_id} (priority={priority})"
+            f"Registered hook {hook_name.label} from plugin {plugin_id} (priority={priority})"
         )
 
     def unregister(self, plugin_id: str) -> int:
         """Unregister all hooks for a plugin. Returns count removed."""
-        before = len(self._hooks)
-        self._hooks = [h for h in self._hooks if h.plugin_id != plugin_id]
-        return before - len(self._hooks)
+        regs = self._by_plugin.pop(plugin_id, [])
+        removed = set(map(id, regs))
+        for reg in regs:
+            hooks = self._by_name[reg.hook_name]
+            if hooks:
+                self._by_name[reg.hook_name] = tuple(
+                    h for h in hooks if id(h) not in removed
+                )
+        return len(regs)
 
-    def get_hooks(self, hook_name: HookName) -> list[HookRegistration]:
+    @property
+    def active(self) -> list[HookName]:
+        """Hook names with at least one registration."""
+        return [name for name in HookName if self._by_name[name]]
+
+    def __contains__(self, hook_name: HookName) -> bool:
+        """Single-lookup check so callers can skip event construction:
+        `if HookName.BEFORE_TOOL_CALL in registry: ...`"""
+        return bool(self._by_name[hook_name])
+
+    def get_hooks(self, hook_name: HookName) -> tuple[HookRegistration, ...]:
         """Get all hooks for a given hook name, sorted by priority (highest first)."""
-        return sorted(
-            [h for h in self._hooks if h.hook_name == hook_name],
-            key=lambda h: h.priority,
-            reverse=True,
-        )
+        return self._by_name[hook_name]
 
     def has_hooks(self, hook_name: HookName) -> bool:
         """Check if any hooks are registered for a hook name."""
-        return any(h.hook_name == hook_name for h in self._hooks)
+        return bool(self._by_name[hook_name])
 
     def get_hook_count(self, hook_name: HookName) -> int:
         """Get count of hooks for a hook name."""
-        return sum(1 for h in self._hooks if h.hook_name == hook_name)
+        return len(self._by_name[hook_name])
 
     def list_all(self) -> list[dict]:
         """List all registered hooks."""
         return [
             {
                 "plugin_id": h.plugin_id,
-                "hook_name": h.hook_name.value,
+                "hook_name": h.hook_name.label,
                 "priority": h.priority,
             }
-            for h in self._hooks
+            for hooks in self._by_name
+            for h in hooks
         ]
 
 
@@ -242,6 +287,46 @@ class HookRegistry:
 # Hook Runner
 # ============================================================
 
+# Merge functions for modifying hooks, hoisted to module scope so no
+# closure object is allocated per dispatch
+
+
+def _merge_before_agent_start(
+    acc: BeforeAgentStartResult, next_: BeforeAgentStartResult
+) -> BeforeAgentStartResult:
+    return BeforeAgentStartResult(
+        system_prompt=next_.system_prompt or acc.system_prompt,
+        prepend_context=(
+            f"{acc.prepend_context}\n\n{next_.prepend_context}"
+            if acc.prepend_context and next_.prepend_context
+            else (next_.prepend_context or acc.prepend_context)
+        ),
+    )
+
+
+def _merge_message_sending(
+    acc: MessageSendingResult, next_: MessageSendingResult
+) -> MessageSendingResult:
+    return MessageSendingResult(
+        content=next_.content or acc.content,
+        cancel=next_.cancel or acc.cancel,
+    )
+
+
+def _merge_before_tool_call(
+    acc: BeforeToolCallResult, next_: BeforeToolCallResult
+) -> BeforeToolCallResult:
+    return BeforeToolCallResult(
+        params=next_.params or acc.params,
+        block=next_.block or acc.block,
+        block_reason=next_.block_reason or acc.block_reason,
+    )
+
+
+def _blocked(result: BeforeToolCallResult) -> bool:
+    # A blocked call is final: later handlers cannot unblock it
+    return result.block
+
 
 class HookRunner:
     """Executes hooks with proper ordering and error handling."""
@@ -249,34 +334,70 @@ class HookRunner:
     def __init__(self, registry: HookRegistry, catch_errors: bool = True):
         self._registry = registry
         self._catch_errors = catch_errors
+        # Bound-method hoist: dispatch is two attribute lookups lighter
+        self._get_hooks = registry.get_hooks
+        # Pick the handler path once: without error catching there is
+        # no try frame or log formatting on the hot path
+        self._run_handler = (
+            self._run_handler_safe if catch_errors else self._run_handler_fast
+        )
 
-    async def _run_handler(
+    def __contains__(self, hook_name: HookName) -> bool:
+        """Mirror of the registry check, for callers holding the runner."""
+        return hook_name in self._registry
+
+    async def _run_handler_fast(
         self, hook: HookRegistration, event: Any, ctx: HookContext
     ) -> Any:
-        """Run a single hook handler."""
+        """Run a single hook handler; exceptions propagate."""
+        # Known-async handlers skip the per-call iscoroutine check;
+        # the fallback still handles wrappers that hide a coroutine
+        if hook.is_async:
+            return await hook.handler(event, ctx)
+        result = hook.handler(event, ctx)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    async def _run_handler_safe(
+        self, hook: HookRegistration, event: Any, ctx: HookContext
+    ) -> Any:
+        """Run a single hook handler, logging and swallowing failures."""
         try:
-            result = hook.handler(event, ctx)
-            if asyncio.iscoroutine(result):
-                result = await result
-            return result
+            return await self._run_handler_fast(hook, event, ctx)
         except Exception as e:
-            if self._catch_errors:
-                logger.error(
-                    f"Hook {hook.hook_name.value} from {hook.plugin_id} failed: {e}"
-                )
-                return None
-            raise
+            logger.error(
+                "Hook %s from %s failed: %s", hook.hook_name.label, hook.plugin_id, e
+            )
+            return None
 
     async def _run_void_hook(
         self, hook_name: HookName, event: Any, ctx: HookContext
     ) -> None:
         """Run a void hook (fire-and-forget, parallel execution)."""
-        hooks = self._registry.get_hooks(hook_name)
+        hooks = self._get_hooks(hook_name)
         if not hooks:
             return
 
-        tasks = [self._run_handler(hook, event, ctx) for hook in hooks]
-        await asyncio.gather(*tasks, return_exceptions=self._catch_errors)
+        # Single handler (the common case): await directly, skipping the
+        # gather future, task wrapping, and extra loop iteration
+        if len(hooks) == 1:
+            hook = hooks[0]
+            if hook.match is None or hook.match(event):
+                await self._run_handler(hook, event, ctx)
+            return
+
+        # No return_exceptions: with catch_errors the safe handler has
+        # already swallowed anything that raised, and without it the
+        # fast handler is meant to propagate - either way gather's
+        # per-task exception shielding is pure overhead
+        tasks = [
+            self._run_handler(hook, event, ctx)
+            for hook in hooks
+            if hook.match is None or hook.match(event)
+        ]
+        if tasks:
+            await asyncio.gather(*tasks)
 
     async def _run_modifying_hook(
         self,
@@ -284,20 +405,48 @@ class HookRunner:
         event: Any,
         ctx: HookContext,
         merge_fn: Callable[[Any, Any], Any] | None = None,
+        terminal_fn: Callable[[Any], bool] | None = None,
     ) -> Any:
-        """Run a modifying hook (sequential, ordered by priority)."""
-        hooks = self._registry.get_hooks(hook_name)
+        """Run a modifying hook (sequential, ordered by priority).
+
+        When `terminal_fn` says the merged result is final (e.g. a tool
+        call got blocked), remaining handlers are skipped - they could
+        not change the outcome anyway.
+        """
+        hooks = self._get_hooks(hook_name)
         if not hooks:
             return None
 
         result = None
         for hook in hooks:
-            handler_result = await self._run_handler(hook, event, ctx)
+            if hook.match is not None and not hook.match(event):
+                continue
+            if hook.is_async:
+                handler_result = await self._run_handler(hook, event, ctx)
+            else:
+                # Sync handler: call inline so the common no-op path
+                # never builds or schedules a coroutine
+                try:
+                    handler_result = hook.handler(event, ctx)
+                    if asyncio.iscoroutine(handler_result):
+                        handler_result = await handler_result
+                except Exception as e:
+                    if not self._catch_errors:
+                        raise
+                    logger.error(
+                        "Hook %s from %s failed: %s",
+                        hook.hook_name.label,
+                        hook.plugin_id,
+                        e,
+                    )
+                    handler_result = None
             if handler_result is not None:
                 if result is not None and merge_fn:
                     result = merge_fn(result, handler_result)
                 else:
                     result = handler_result
+                if terminal_fn is not None and terminal_fn(result):
+                    return result
 
         return result
 
@@ -309,19 +458,8 @@ class HookRunner:
         self, event: BeforeAgentStartEvent, ctx: HookContext
     ) -> BeforeAgentStartResult | None:
         """Run before_agent_start hooks."""
-
-        def merge(acc: BeforeAgentStartResult, next_: BeforeAgentStartResult):
-            return BeforeAgentStartResult(
-                system_prompt=next_.system_prompt or acc.system_prompt,
-                prepend_context=(
-                    f"{acc.prepend_context}\n\n{next_.prepend_context}"
-                    if acc.prepend_context and next_.prepend_context
-                    else (next_.prepend_context or acc.prepend_context)
-                ),
-            )
-
         return await self._run_modifying_hook(
-            HookName.BEFORE_AGENT_START, event, ctx, merge
+            HookName.BEFORE_AGENT_START, event, ctx, _merge_before_agent_start
         )
 
     async def run_agent_end(self, event: AgentEndEvent, ctx: HookContext) -> None:
@@ -342,15 +480,8 @@ class HookRunner:
         self, event: MessageSendingEvent, ctx: HookContext
     ) -> MessageSendingResult | None:
         """Run message_sending hooks."""
-
-        def merge(acc: MessageSendingResult, next_: MessageSendingResult):
-            return MessageSendingResult(
-                content=next_.content or acc.content,
-                cancel=next_.cancel or acc.cancel,
-            )
-
         return await self._run_modifying_hook(
-            HookName.MESSAGE_SENDING, event, ctx, merge
+            HookName.MESSAGE_SENDING, event, ctx, _merge_message_sending
         )
 
     async def run_message_sent(self, event: MessageSentEvent, ctx: HookContext) -> None:
@@ -365,16 +496,12 @@ class HookRunner:
         self, event: BeforeToolCallEvent, ctx: HookContext
     ) -> BeforeToolCallResult | None:
         """Run before_tool_call hooks."""
-
-        def merge(acc: BeforeToolCallResult, next_: BeforeToolCallResult):
-            return BeforeToolCallResult(
-                params=next_.params or acc.params,
-                block=next_.block or acc.block,
-                block_reason=next_.block_reason or acc.block_reason,
-            )
-
         return await self._run_modifying_hook(
-            HookName.BEFORE_TOOL_CALL, event, ctx, merge
+            HookName.BEFORE_TOOL_CALL,
+            event,
+            ctx,
+            _merge_before_tool_call,
+            terminal_fn=_blocked,
         )
 
     async def run_after_tool_call(
@@ -6,6 +6,7 @@ Handles plugin discovery, loading, and lifecycle management.
 
 import importlib
 import importlib.util
+import json
 import logging
 import pkgutil
 from dataclasses import dataclass, field
@@ -15,12 +16,37 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .base import Plugin
 
+from ..config import DATA_DIR
 from ..tools.base import Tool
 
 logger = logging.getLogger(__name__)
 
+# Modules in this package that are infrastructure, not plugins
+_EXCLUDED_MODULES = frozenset({"base", "loader", "hooks", "__init__"})
 
-@dataclass
+# Discovery cache: remembers which export each plugin module uses,
+# keyed by file signature, so unchanged modules skip the attribute scan
+_DISCOVERY_CACHE_FILE = DATA_DIR / "plugin_cache.json"
+
+
+def _load_discovery_cache() -> dict:
+    try:
+        with open(_DISCOVERY_CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_discovery_cache(cache: dict) -> None:
+    try:
+        _DISCOVERY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_DISCOVERY_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+@dataclass(slots=True)
 class PluginInfo:
     """Information about a loaded plugin."""
 
@@ -28,6 +54,9 @@ class PluginInfo:
     enabled: bool = True
     load_error: str | None = None
     hook_count: int = 0
+    # Captured once at register-time: plugin.get_tools() builds fresh
+    # Tool instances per call, and stable identity matters for dispatch
+    tools: list[Tool] = field(default_factory=list)
 
 
 class PluginRegistry:
@@ -69,6 +98,7 @@ class PluginRegistry:
                 plugin=plugin,
                 enabled=True,
                 hook_count=hook_count,
+                tools=plugin.get_tools(),
             )
             self._tool_cache = None  # Invalidate cache
 
@@ -119,12 +149,7 @@ class PluginRegistry:
         tools = []
         for info in self._plugins.values():
             if info.enabled:
-                try:
-                    tools.extend(info.plugin.get_tools())
-                except Exception as e:
-                    logger.error(
-                        f"Error getting tools from plugin '{info.plugin.manifest.id}': {e}"
-                    )
+                tools.extend(info.tools)
 
         self._tool_cache = tools
         return tools
@@ -152,11 +177,14 @@ class PluginRegistry:
         hook_registry = get_hook_registry()
         result = []
 
+        # One pass over the hook list instead of one filter per plugin
+        hooks_by_plugin: dict[str, list[dict]] = {}
+        for h in hook_registry.list_all():
+            hooks_by_plugin.setdefault(h["plugin_id"], []).append(h)
+
         for plugin_id, info in self._plugins.items():
             manifest = info.plugin.manifest
-
-            # Count hooks for this plugin
-            hooks = [h for h in hook_registry.list_all() if h["plugin_id"] == plugin_id]
+            hooks = hooks_by_plugin.get(plugin_id, [])
 
             result.append(
                 {
@@ -165,7 +193,7 @@ class PluginRegistry:
                     "version": manifest.version,
                     "description": manifest.description,
                     "enabled": info.enabled,
-                    "tools": [t.name for t in info.plugin.get_tools()],
+                    "tools": [t.name for t in info.tools],
                     "hooks": [h["hook_name"] for h in hooks],
                 }
             )
@@ -181,49 +209,109 @@ def get_registry() -> PluginRegistry:
     return _registry
 
 
+def _load_export(module, name: str) -> "Plugin | None":
+    """Materialize a cached plugin export from an already-imported module."""
+    from .base import Plugin
+
+    target = getattr(module, name, None)
+    if name == "get_plugin" and callable(target):
+        target = target()
+    elif isinstance(target, type) and issubclass(target, Plugin):
+        try:
+            target = target()
+        except Exception as e:
+            logger.error(f"Failed to instantiate plugin {name}: {e}")
+            return None
+    return target if isinstance(target, Plugin) else None
+
+
 def load_builtin_plugins() -> None:
     """Load all built-in plugins from the plugins directory."""
     from .base import Plugin
 
     plugins_dir = Path(__file__).parent
-
-    # Find all Python files in plugins directory (excluding base.py, loader.py, hooks.py, __init__.py)
-    excluded = {"base", "loader", "hooks", "__init__"}
+    cache = _load_discovery_cache()
+    dirty = False
 
     for _, module_name, _ in pkgutil.iter_modules([str(plugins_dir)]):
-        if module_name in excluded:
+        if module_name in _EXCLUDED_MODULES:
             continue
 
+        source = plugins_dir / f"{module_name}.py"
+        try:
+            st = source.stat()
+            sig = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            sig = None
+
         try:
+            before = set(Plugin.__subclasses__())
             module = importlib.import_module(
                 f".{module_name}", package="squidbot.plugins"
             )
 
-            # Look for get_plugin() function or Plugin subclass
-            if hasattr(module, "get_plugin"):
+            # Unchanged module with cached discovery: go straight to
+            # the recorded exports, skipping the scan below
+            entry = cache.get(module_name)
+            if entry is not None and sig is not None and entry.get("sig") == sig:
+                registered = False
+                for export in entry.get("exports", []):
+                    plugin = _load_export(module, export)
+                    if plugin is not None:
+                        _registry.register(plugin)
+                        registered = True
+                if registered:
+                    continue
+                # Stale hint: fall through to full discovery
+
+            # Explicit exports first (a __plugin__ instance or a
+            # get_plugin() factory); only scan every module attribute
+            # when neither convention is present
+            exports: list[str] = []
+            explicit = getattr(module, "__plugin__", None)
+            if isinstance(explicit, Plugin):
+                _registry.register(explicit)
+                exports.append("__plugin__")
+            elif hasattr(module, "get_plugin"):
                 plugin = module.get_plugin()
                 if isinstance(plugin, Plugin):
                     _registry.register(plugin)
+                    exports.append("get_plugin")
             else:
-                # Search for Plugin subclasses
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
+                # The import itself reports which Plugin subclasses it
+                # defined - O(new subclasses) instead of O(module attrs)
+                new_subs = [
+                    cls
+                    for cls in Plugin.__subclasses__()
+                    if cls not in before and cls.__module__ == module.__name__
+                ]
+                if not new_subs:
+                    # Module was already imported: scan its attributes
+                    new_subs = [
+                        attr
+                        for attr_name in dir(module)
+                        if isinstance(attr := getattr(module, attr_name), type)
                         and issubclass(attr, Plugin)
                         and attr is not Plugin
-                    ):
-                        try:
-                            plugin = attr()
-                            _registry.register(plugin)
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to instantiate plugin {attr_name}: {e}"
-                            )
+                    ]
+                for cls in new_subs:
+                    try:
+                        plugin = cls()
+                        _registry.register(plugin)
+                        exports.append(cls.__name__)
+                    except Exception as e:
+                        logger.error(f"Failed to instantiate plugin {cls.__name__}: {e}")
+
+            if sig is not None and exports:
+                cache[module_name] = {"sig": sig, "exports": exports}
+                dirty = True
 
         except Exception as e:
             logger.error(f"Failed to load plugin module '{module_name}': {e}")
 
+    if dirty:
+        _save_discovery_cache(cache)
+
 
 def load_external_plugins(plugins_dir: Path) -> None:
     """Load plugins from an external directory."""
@@ -12,8 +12,13 @@ Hooks:
 - after_tool_call: Log transaction results
 """
 
+import asyncio
+import functools
+import itertools
 import logging
 import os
+import threading
+import time
 from typing import Any
 
 from dotenv import load_dotenv
@@ -34,21 +39,139 @@ SQUIDBOT_WALLET_INDEX = int(os.environ.get("SQUIDBOT_WALLET_INDEX", "0"))
 SQUIDBOT_CHAINID = int(os.environ.get("SQUIDBOT_CHAINID", "338"))
 SQUIDBOT_RPC = os.environ.get("SQUIDBOT_RPC", "https://evm-dev-t3.cronos.org")
 
+# Tool names this plugin's hooks care about
+WEB3_TOOL_NAMES = frozenset({"send_cro", "get_balance", "wallet_info", "get_tx_count"})
+
+# How long the first RPC request in a burst waits for others to pile on
+RPC_BATCH_WINDOW = 0.005
+
+
+class _RpcBatcher:
+    """Coalesce concurrent JSON-RPC requests into one batched POST.
+
+    Tool calls issue their RPC reads from worker threads; when several
+    land within the batch window, the first arrival waits briefly for
+    the others, sends the whole batch as a single JSON array, and fans
+    the responses back out by request id. A burst of N reads costs one
+    HTTP round-trip instead of N.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        window: float = RPC_BATCH_WINDOW,
+        post=None,
+    ):
+        self._endpoint = endpoint
+        self._window = window
+        self._lock = threading.Lock()
+        self._pending: list[tuple[dict, threading.Event, dict]] = []
+        self._ids = itertools.count(1)
+        if post is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            # One keep-alive session for all RPC traffic: the TCP+TLS
+            # handshake is paid once, not per call. A single upstream
+            # needs one pooled host; headroom for concurrent flushes
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            post = lambda payload: session.post(
+                endpoint, json=payload, timeout=30
+            ).json()
+        self._post = post
+
+    def call(self, method: str, params) -> dict:
+        """Issue one JSON-RPC request; blocks until its response arrives."""
+        request = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": list(params),
+            "id": next(self._ids),
+        }
+        done = threading.Event()
+        slot: dict = {}
+        with self._lock:
+            self._pending.append((request, done, slot))
+            leader = len(self._pending) == 1
+
+        if leader:
+            # First in the burst: give followers the window to queue up,
+            # then flush everything in one POST
+            time.sleep(self._window)
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+            self._flush(batch)
+        else:
+            done.wait()
+        return slot["response"]
 
+    def _flush(self, batch: list[tuple[dict, threading.Event, dict]]) -> None:
+        payload = [request for request, _, _ in batch]
+        try:
+            # Lone requests go as a plain object for server compatibility
+            raw = self._post(payload if len(payload) > 1 else payload[0])
+        except Exception as e:
+            error = {"code": -32603, "message": str(e)}
+            for request, done, slot in batch:
+                slot["response"] = {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "error": error,
+                }
+                done.set()
+            return
+
+        responses = raw if isinstance(raw, list) else [raw]
+        by_id = {r.get("id"): r for r in responses}
+        for request, done, slot in batch:
+            slot["response"] = by_id.get(
+                request["id"],
+                {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "error": {"code": -32603, "message": "missing batch response"},
+                },
+            )
+            done.set()
+
+
+@functools.cache
 def get_web3():
-    """Get Web3 instance connected to configured RPC."""
+    """Get the Web3 instance connected to the configured RPC.
+
+    Cached: the provider (and its keep-alive HTTP session) is built
+    once and reused across tool calls. Requests are routed through the
+    batcher so concurrent reads share one HTTP round-trip.
+    """
     try:
-        from web3 import Web3
+        from web3 import HTTPProvider, Web3
 
-        w3 = Web3(Web3.HTTPProvider(SQUIDBOT_RPC))
-        return w3
+        batcher = _RpcBatcher(SQUIDBOT_RPC)
+
+        class BatchingHTTPProvider(HTTPProvider):
+            """HTTPProvider that coalesces concurrent requests."""
+
+            def make_request(self, method, params):
+                return batcher.call(method, params)
+
+        return Web3(BatchingHTTPProvider(SQUIDBOT_RPC))
     except ImportError:
         logger.error("web3 package not installed. Run: pip install web3")
         raise
 
 
+@functools.cache
 def get_wallet():
-    """Get wallet from mnemonic or generate random."""
+    """Get wallet from mnemonic or generate random.
+
+    Cached: HD derivation (2048-round PBKDF2) runs once per process
+    instead of on every tool call. The random-mnemonic fallback is
+    likewise generated once, so all tools see the same wallet.
+    """
     try:
         from eth_account import Account
 
@@ -148,7 +271,8 @@ class GetBalanceTool(Tool):
                 return {"success": False, "error": f"Invalid address: {address}"}
 
             checksum_address = w3.to_checksum_address(address)
-            balance_wei = w3.eth.get_balance(checksum_address)
+            # Blocking HTTP round-trip: keep it off the event loop
+            balance_wei = await asyncio.to_thread(w3.eth.get_balance, checksum_address)
             balance_cro = w3.from_wei(balance_wei, "ether")
 
             return {
@@ -202,8 +326,13 @@ class SendCROTool(Tool):
             to_checksum = w3.to_checksum_address(to_address)
             amount_wei = w3.to_wei(float(amount), "ether")
 
-            # Get current nonce
-            nonce = w3.eth.get_transaction_count(account.address)
+            # Fetch nonce and gas price concurrently in worker threads:
+            # the two HTTP round-trips overlap instead of serializing,
+            # and neither blocks the event loop
+            nonce, gas_price = await asyncio.gather(
+                asyncio.to_thread(w3.eth.get_transaction_count, account.address),
+                asyncio.to_thread(getattr, w3.eth, "gas_price"),
+            )
 
             # Build transaction
             tx = {
@@ -211,7 +340,7 @@ class SendCROTool(Tool):
                 "to": to_checksum,
                 "value": amount_wei,
                 "gas": 21000,  # Standard ETH transfer
-                "gasPrice": w3.eth.gas_price,
+                "gasPrice": gas_price,
                 "chainId": SQUIDBOT_CHAINID,
             }
 
@@ -269,7 +398,10 @@ class GetTxCountTool(Tool):
                 return {"success": False, "error": f"Invalid address: {address}"}
 
             checksum_address = w3.to_checksum_address(address)
-            tx_count = w3.eth.get_transaction_count(checksum_address)
+            # Blocking HTTP round-trip: keep it off the event loop
+            tx_count = await asyncio.to_thread(
+                w3.eth.get_transaction_count, checksum_address
+            )
 
             return {
                 "success": True,
@@ -329,24 +461,20 @@ class Web3Plugin(Plugin):
     def register_hooks(self, api: PluginApi) -> None:
         """Register hooks for transaction monitoring."""
 
-        # Hook: Before tool call - monitor and optionally block transactions
-        async def on_before_tool_call(
+        # Hook: Before tool call - monitor and optionally block
+        # transactions. Plain def: it never awaits, and sync handlers
+        # run inline in the hook runner without coroutine scheduling
+        def on_before_tool_call(
             event: BeforeToolCallEvent, ctx: HookContext
         ) -> BeforeToolCallResult | None:
-            # Only interested in web3 tools
-            if event.tool_name not in (
-                "send_cro",
-                "get_balance",
-                "wallet_info",
-                "get_tx_count",
-            ):
-                return None
-
-            logger.info(f"[Web3 Hook] Before {event.tool_name}: {event.params}")
-
-            # Example: Block large transactions (over 100 CRO)
+            # %-style args: params are only repr'd if INFO is enabled
+            logger.info("[Web3 Hook] Before %s: %s", event.tool_name, event.params)
+
+            # Example: Block large transactions (over 100 CRO); skip the
+            # float parse entirely when no amount was supplied
             if event.tool_name == "send_cro":
-                amount = float(event.params.get("amount", 0))
+                raw_amount = event.params.get("amount")
+                amount = float(raw_amount) if raw_amount is not None else 0.0
                 if amount > 100:
                     logger.warning(
                         f"[Web3 Hook] Blocking large transaction: {amount} CRO"
@@ -358,35 +486,37 @@ class Web3Plugin(Plugin):
 
             return None
 
-        # Hook: After tool call - log results
-        async def on_after_tool_call(
-            event: AfterToolCallEvent, ctx: HookContext
-        ) -> None:
-            # Only interested in web3 tools
-            if event.tool_name not in (
-                "send_cro",
-                "get_balance",
-                "wallet_info",
-                "get_tx_count",
-            ):
-                return
-
+        # Hook: After tool call - log results (plain def, same reason)
+        def on_after_tool_call(event: AfterToolCallEvent, ctx: HookContext) -> None:
             if event.error:
-                logger.error(f"[Web3 Hook] {event.tool_name} failed: {event.error}")
+                logger.error("[Web3 Hook] %s failed: %s", event.tool_name, event.error)
             else:
                 logger.info(
-                    f"[Web3 Hook] {event.tool_name} completed in {event.duration_ms:.2f}ms"
+                    "[Web3 Hook] %s completed in %.2fms",
+                    event.tool_name,
+                    event.duration_ms,
                 )
 
                 # Log transaction hash for send_cro
                 if event.tool_name == "send_cro" and isinstance(event.result, dict):
                     tx_hash = event.result.get("tx_hash")
                     if tx_hash:
-                        logger.info(f"[Web3 Hook] Transaction hash: {tx_hash}")
-
-        # Register hooks with priority
-        api.on(HookName.BEFORE_TOOL_CALL, on_before_tool_call, priority=10)
-        api.on(HookName.AFTER_TOOL_CALL, on_after_tool_call, priority=10)
+                        logger.info("[Web3 Hook] Transaction hash: %s", tx_hash)
+
+        # Register hooks with priority; the match filter keeps the
+        # handlers off the dispatch path for unrelated tools entirely
+        api.on(
+            HookName.BEFORE_TOOL_CALL,
+            on_before_tool_call,
+            priority=10,
+            match=WEB3_TOOL_NAMES,
+        )
+        api.on(
+            HookName.AFTER_TOOL_CALL,
+            on_after_tool_call,
+            priority=10,
+            match=WEB3_TOOL_NAMES,
+        )
 
     def activate(self) -> None:
         logger.info(f"Web3 Plugin activated - Chain ID: {SQUIDBOT_CHAINID}")
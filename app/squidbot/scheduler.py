@@ -2,18 +2,28 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Awaitable, Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from .config import HEARTBEAT_INTERVAL_MINUTES
-from .tools.cron import load_cron_jobs, save_cron_jobs
+from .tools.cron import consume_jobs_dirty, load_cron_jobs, save_cron_jobs
 
 logger = logging.getLogger(__name__)
 
+# Cap on scheduled jobs running the agent at once - each run is an LLM
+# round-trip, so a burst of due jobs must not fan out unbounded
+MAX_CONCURRENT_AGENT_RUNS = 3
+
+# After this much user inactivity, heartbeat checks stop burning LLM
+# calls; the next incoming message resumes them
+HEARTBEAT_IDLE_SKIP_SECONDS = 6 * 3600
+
 
 class Scheduler:
     """Manages scheduled tasks and heartbeat."""
@@ -29,6 +39,13 @@ class Scheduler:
         self.run_agent = run_agent
         self.chat_id = chat_id  # Default chat to send proactive messages
         self._started = False
+        self._agent_sem = asyncio.Semaphore(MAX_CONCURRENT_AGENT_RUNS)
+        self._heartbeat_lock = asyncio.Lock()
+        # Treat boot as activity so heartbeats run until truly idle
+        self._last_activity_ts = time.time()
+        # Cron job store, read once and cached; job callbacks mutate
+        # entries in place and persist the whole list through it
+        self._jobs_cache: list[dict] | None = None
 
     def start(self):
         """Start the scheduler."""
@@ -45,27 +62,14 @@ class Scheduler:
                 IntervalTrigger(minutes=HEARTBEAT_INTERVAL_MINUTES),
                 id="heartbeat",
                 replace_existing=True,
+                coalesce=True,
+                max_instances=1,
+                misfire_grace_time=60,
             )
             logger.info(
                 f"Heartbeat scheduled every {HEARTBEAT_INTERVAL_MINUTES} minutes"
             )
 
-        # Check one-time jobs every minute
-        self.scheduler.add_job(
-            self._check_one_time_jobs,
-            IntervalTrigger(minutes=1),
-            id="one_time_checker",
-            replace_existing=True,
-        )
-
-        # Check interval jobs every 5 seconds
-        self.scheduler.add_job(
-            self._check_interval_jobs,
-            IntervalTrigger(seconds=5),
-            id="interval_checker",
-            replace_existing=True,
-        )
-
         self.scheduler.start()
         self._started = True
         logger.info("Scheduler started")
@@ -76,139 +80,202 @@ class Scheduler:
             self.scheduler.shutdown()
             self._started = False
 
+    def _get_jobs(self) -> list[dict]:
+        """Get the cron job list, loading from storage once and caching."""
+        if self._jobs_cache is None:
+            self._jobs_cache = load_cron_jobs()
+        return self._jobs_cache
+
+    def invalidate(self) -> None:
+        """Drop the cached job list; the next access re-reads storage."""
+        self._jobs_cache = None
+
+    def _persist_job(self, job: dict, fields: tuple[str, ...]) -> None:
+        """Write a job's mutated fields through to the store by id.
+
+        The dict a callback holds may be stale: invalidate() can reload
+        the cache while the job's agent run is in flight (a user message
+        touching the cron tools does exactly that). Locating the current
+        entry by id keeps the mutation from being lost - or a disabled
+        reminder from being resurrected - by saving a stale list.
+        """
+        jobs = self._get_jobs()
+        for current in jobs:
+            if current.get("id") == job.get("id"):
+                for field in fields:
+                    current[field] = job[field]
+                save_cron_jobs(jobs)
+                return
+        # Job was removed from the store while running; nothing to persist
+
     def _load_cron_jobs(self):
-        """Load cron jobs from storage and schedule them."""
-        jobs = load_cron_jobs()
+        """Load jobs from storage and register each with its own trigger.
+
+        Every job type gets a precise APScheduler trigger, so the event
+        loop only wakes when something is actually due - no poll ticks.
+        """
+        jobs = self._get_jobs()
         for job in jobs:
-            if job.get("type") == "cron" and job.get("enabled", True):
-                try:
+            if not job.get("enabled", True):
+                continue
+            job_type = job.get("type")
+            try:
+                if job_type == "cron":
                     self.scheduler.add_job(
                         self._run_cron_job,
                         CronTrigger.from_crontab(job["cron_expression"]),
                         id=f"cron_{job['id']}",
                         args=[job],
                         replace_existing=True,
+                        coalesce=True,
+                        max_instances=1,
+                        misfire_grace_time=60,
                     )
                     logger.info(
                         f"Scheduled cron job {job['id']}: {job['cron_expression']}"
                     )
-                except Exception as e:
-                    logger.error(f"Failed to schedule job {job['id']}: {e}")
+                elif job_type == "one_time":
+                    self.scheduler.add_job(
+                        self._run_one_time_job,
+                        DateTrigger(
+                            run_date=datetime.fromisoformat(job["trigger_at"])
+                        ),
+                        id=f"one_time_{job['id']}",
+                        args=[job],
+                        replace_existing=True,
+                        coalesce=True,
+                        max_instances=1,
+                        # Overdue reminders (missed while offline) still
+                        # fire on startup instead of being dropped
+                        misfire_grace_time=None,
+                    )
+                    logger.info(
+                        f"Scheduled one-time job {job['id']}: {job['trigger_at']}"
+                    )
+                elif job_type == "interval":
+                    start_date = None
+                    if job.get("next_trigger"):
+                        start_date = datetime.fromisoformat(job["next_trigger"])
+                    self.scheduler.add_job(
+                        self._run_interval_job,
+                        IntervalTrigger(
+                            seconds=job.get("interval_seconds", 60),
+                            start_date=start_date,
+                        ),
+                        id=f"interval_{job['id']}",
+                        args=[job],
+                        replace_existing=True,
+                        coalesce=True,
+                        max_instances=1,
+                        misfire_grace_time=60,
+                    )
+                    logger.info(
+                        f"Scheduled interval job {job['id']}: "
+                        f"every {job.get('interval_seconds', 60)}s"
+                    )
+            except Exception as e:
+                logger.error("Failed to schedule job %s: %s", job["id"], e)
 
     async def _run_cron_job(self, job: dict):
         """Execute a cron job by running the agent."""
-        logger.info(f"Running cron job {job['id']}: {job['message']}")
+        logger.info("Running cron job %s: %s", job["id"], job["message"])
         try:
             # Run agent to actually perform the task
-            response = await self.run_agent(job["message"])
+            async with self._agent_sem:
+                response = await self.run_agent(job["message"])
             await self.send_message(f"[Scheduled Task]\n{response}")
         except Exception as e:
-            logger.error(f"Failed to run cron job: {e}")
+            logger.error("Failed to run cron job: %s", e)
             await self.send_message(
                 f"[Scheduled Task Failed] {job['message']}\nError: {str(e)}"
             )
 
-    async def _check_one_time_jobs(self):
-        """Check and execute one-time jobs that are due."""
-        jobs = load_cron_jobs()
-        now = datetime.now()
-        updated = False
-
-        for job in jobs:
-            if job.get("type") != "one_time" or not job.get("enabled", True):
-                continue
-
-            trigger_at = datetime.fromisoformat(job["trigger_at"])
-            if trigger_at <= now:
-                logger.info(f"Triggering one-time job {job['id']}: {job['message']}")
-                try:
-                    # Run agent to actually perform the task
-                    response = await self.run_agent(job["message"])
-                    await self.send_message(f"[Reminder]\n{response}")
-                    job["enabled"] = False  # Disable after triggering
-                    updated = True
-                except Exception as e:
-                    logger.error(f"Failed to run reminder job: {e}")
-                    await self.send_message(
-                        f"[Reminder Failed] {job['message']}\nError: {str(e)}"
-                    )
-                    job["enabled"] = False
-                    updated = True
-
-        if updated:
-            save_cron_jobs(jobs)
-
-    async def _check_interval_jobs(self):
-        """Check and execute interval jobs that are due."""
-        jobs = load_cron_jobs()
-        now = datetime.now()
-        updated = False
-
-        for job in jobs:
-            if job.get("type") != "interval" or not job.get("enabled", True):
-                continue
+    async def _run_one_time_job(self, job: dict):
+        """Execute a one-time job at its trigger time, then disable it."""
+        logger.info("Triggering one-time job %s: %s", job["id"], job["message"])
+        try:
+            # Run agent to actually perform the task
+            async with self._agent_sem:
+                response = await self.run_agent(job["message"])
+            await self.send_message(f"[Reminder]\n{response}")
+        except Exception as e:
+            logger.error("Failed to run reminder job: %s", e)
+            await self.send_message(
+                f"[Reminder Failed] {job['message']}\nError: {str(e)}"
+            )
+        job["enabled"] = False  # Disable after triggering
+        self._persist_job(job, ("enabled",))
 
-            next_trigger = datetime.fromisoformat(
-                job.get("next_trigger", now.isoformat())
+    async def _run_interval_job(self, job: dict):
+        """Execute an interval job; APScheduler schedules the next run."""
+        logger.info("Triggering interval job %s: %s", job["id"], job["message"])
+        try:
+            # Run agent to actually perform the task
+            async with self._agent_sem:
+                response = await self.run_agent(job["message"])
+            await self.send_message(f"[Interval Task]\n{response}")
+        except Exception as e:
+            logger.error("Failed to run interval job: %s", e)
+            await self.send_message(
+                f"[Interval Task Failed] {job['message']}\nError: {str(e)}"
             )
-            if next_trigger <= now:
-                logger.info(f"Triggering interval job {job['id']}: {job['message']}")
-                try:
-                    # Run agent to actually perform the task
-                    response = await self.run_agent(job["message"])
-                    await self.send_message(f"[Interval Task]\n{response}")
-
-                    # Schedule next trigger
-                    interval = job.get("interval_seconds", 60)
-                    job["next_trigger"] = (
-                        datetime.now() + timedelta(seconds=interval)
-                    ).isoformat()
-                    updated = True
-                except Exception as e:
-                    logger.error(f"Failed to run interval job: {e}")
-                    await self.send_message(
-                        f"[Interval Task Failed] {job['message']}\nError: {str(e)}"
-                    )
-                    # Still schedule next trigger
-                    interval = job.get("interval_seconds", 60)
-                    job["next_trigger"] = (
-                        datetime.now() + timedelta(seconds=interval)
-                    ).isoformat()
-                    updated = True
 
-        if updated:
-            save_cron_jobs(jobs)
+        # Persist the next due time so a restart resumes the cadence
+        next_ts = time.time() + job.get("interval_seconds", 60)
+        job["next_trigger"] = datetime.fromtimestamp(next_ts).isoformat()
+        self._persist_job(job, ("next_trigger",))
+
+    def record_activity(self) -> None:
+        """Mark user activity; keeps heartbeat checks running while active."""
+        self._last_activity_ts = time.time()
 
     async def _heartbeat(self):
         """Periodic heartbeat - ask agent if there's anything to report."""
         if not self.chat_id:
             return
 
+        if self._heartbeat_lock.locked():
+            logger.debug("Skipping heartbeat: previous check still running")
+            return
+
+        idle = time.time() - self._last_activity_ts
+        if idle > HEARTBEAT_IDLE_SKIP_SECONDS:
+            logger.debug("Skipping heartbeat: no user activity for %.0fs", idle)
+            return
+
         logger.info("Running heartbeat check")
         try:
-            # Ask the agent if there's anything to proactively share
-            response = await self.run_agent(
-                "This is a periodic heartbeat check. "
-                "If there's anything important to proactively share with the user "
-                "(e.g., completed background tasks, reminders, or relevant updates), "
-                "please say it. Otherwise, respond with just 'HEARTBEAT_OK' and nothing else."
-            )
+            async with self._heartbeat_lock:
+                # Ask the agent if there's anything to proactively share
+                response = await self.run_agent(
+                    "This is a periodic heartbeat check. "
+                    "If there's anything important to proactively share with the user "
+                    "(e.g., completed background tasks, reminders, or relevant updates), "
+                    "please say it. Otherwise, respond with just 'HEARTBEAT_OK' and nothing else."
+                )
 
             if response.strip() != "HEARTBEAT_OK":
                 await self.send_message(response)
         except Exception as e:
-            logger.error(f"Heartbeat error: {e}")
+            logger.error("Heartbeat error: %s", e)
 
     def reload_jobs(self):
         """Reload cron jobs from storage."""
-        # Remove existing cron jobs
+        self.invalidate()
+
+        # Remove previously registered store-backed jobs
         for job in self.scheduler.get_jobs():
-            if job.id.startswith("cron_"):
+            if job.id.startswith(("cron_", "one_time_", "interval_")):
                 job.remove()
 
         # Reload
         self._load_cron_jobs()
 
+    def reload_if_dirty(self) -> None:
+        """Reload jobs only if a scheduling tool changed the store."""
+        if consume_jobs_dirty():
+            self.reload_jobs()
+
     def set_chat_id(self, chat_id: int):
         """Set the default chat ID for proactive messages."""
         self.chat_id = chat_id
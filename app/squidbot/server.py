@@ -10,10 +10,13 @@ import asyncio
 import json
 import logging
 import signal
+import socket
+
+import orjson
 
 from .agent import run_agent_with_history
 from .channels import (ChannelRouter, MessagePayload, TCPAdapter,
-                       TelegramAdapter, get_channel_router)
+                       TelegramAdapter, frame_message, get_channel_router)
 from .config import (OPENAI_API_KEY, SQUID_PORT, TELEGRAM_BOT_TOKEN,
                      init_default_files, show_startup_info)
 from .lanes import LANE_CRON, LANE_MAIN, CommandLane
@@ -22,6 +25,15 @@ from .scheduler import Scheduler
 from .session import (ChannelType, DeliveryContext, Session,
                       get_session_manager, record_inbound_session)
 
+# libuv event loop: faster socket paths for the TCP server and Telegram
+# polling (unavailable on Windows)
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 # Server configuration
 SERVER_HOST = "127.0.0.1"
 SERVER_PORT = SQUID_PORT
@@ -35,6 +47,9 @@ logger = logging.getLogger(__name__)
 # Connected TCP clients (for broadcasting scheduled messages)
 connected_clients: dict[str, asyncio.StreamWriter] = {}
 
+# Preserialized, preframed pong reply for the ping fast path
+_PONG_FRAME = frame_message(b'{"status": "ok", "response": "pong"}')
+
 # Scheduler instance
 scheduler: Scheduler | None = None
 
@@ -44,6 +59,14 @@ telegram_app = None
 # Server running flag
 running = True
 
+# Shutdown event (created lazily inside the running event loop)
+_shutdown_event: asyncio.Event | None = None
+
+# Bounded queue feeding the agent worker pool (created in async_main)
+AGENT_WORKERS = 4
+AGENT_QUEUE_SIZE = 256
+_agent_queue: asyncio.Queue | None = None
+
 # Session manager
 session_manager = get_session_manager()
 
@@ -59,18 +82,25 @@ channel_router = get_channel_router()
 async def broadcast_to_clients(message: str):
     """Send a message to all connected TCP clients via channel router."""
     if not connected_clients:
-        logger.info(f"[Broadcast] No clients connected: {message[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[Broadcast] No clients connected: %s...", message[:50])
         return
 
     payload = MessagePayload(text=message)
-    for client_id in list(connected_clients.keys()):
+    log_info = logger.isEnabledFor(logging.INFO)
+    for client_id, client_writer in list(connected_clients.items()):
+        # Drop known-dead sockets before paying for serialization + send
+        if client_writer.is_closing():
+            connected_clients.pop(client_id, None)
+            continue
         context = DeliveryContext(
             channel=ChannelType.TCP,
             recipient_id=client_id,
         )
         success = await channel_router.send(context, payload)
         if success:
-            logger.info(f"[Broadcast] Sent to {client_id}")
+            if log_info:
+                logger.info("[Broadcast] Sent to %s", client_id)
         else:
             # Remove disconnected clients
             connected_clients.pop(client_id, None)
@@ -91,12 +121,13 @@ async def send_to_telegram(message: str):
 
     success = await channel_router.send(context, payload)
     if success:
-        logger.info(f"[Telegram] Sent message to chat {scheduler.chat_id}")
+        logger.info("[Telegram] Sent message to chat %s", scheduler.chat_id)
 
 
 async def send_scheduled_message(message: str):
     """Send scheduled message to all active channels."""
-    logger.info(f"[Scheduled] {message[:100]}...")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[Scheduled] %s...", message[:100])
 
     # Broadcast to all active sessions
     contexts = session_manager.get_active_delivery_contexts()
@@ -105,13 +136,45 @@ async def send_scheduled_message(message: str):
     if contexts:
         results = await channel_router.broadcast(contexts, payload)
         success_count = sum(1 for v in results.values() if v)
-        logger.info(f"[Scheduled] Broadcast to {success_count}/{len(results)} channels")
+        logger.info(
+            "[Scheduled] Broadcast to %d/%d channels", success_count, len(results)
+        )
     else:
         # Fallback to legacy broadcast
         await broadcast_to_clients(message)
         await send_to_telegram(message)
 
 
+# ============================================================
+# Agent worker pool
+# ============================================================
+
+
+async def _agent_worker():
+    """Consume queued agent jobs so slow LLM calls don't block socket I/O."""
+    while True:
+        message, history, future = await _agent_queue.get()
+        try:
+            result = await run_agent_with_history(message, history)
+            if not future.cancelled():
+                future.set_result(result)
+        except Exception as e:
+            if not future.cancelled():
+                future.set_exception(e)
+        finally:
+            _agent_queue.task_done()
+
+
+async def run_agent_queued(message: str, history: list) -> tuple[str, list]:
+    """Run the agent via the worker pool (falls back to a direct call)."""
+    if _agent_queue is None:
+        return await run_agent_with_history(message, history)
+
+    future = asyncio.get_running_loop().create_future()
+    await _agent_queue.put((message, history, future))
+    return await future
+
+
 # ============================================================
 # Local TCP server for client connections
 # ============================================================
@@ -121,10 +184,25 @@ async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWrit
     """Handle a local client connection."""
     addr = writer.get_extra_info("peername")
     client_id = f"{addr[0]}:{addr[1]}"
-    logger.info(f"Client connected: {client_id}")
+    logger.info("Client connected: %s", client_id)
+
+    # Small newline-delimited JSON messages: disable Nagle so replies
+    # aren't delayed waiting for more outgoing data, and keep the
+    # connection alive across idle periods.
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
 
-    # Register client for broadcasts
+    # Register client for broadcasts; deregister automatically once the
+    # connection is fully closed so dead entries never reach a broadcast
     connected_clients[client_id] = writer
+    asyncio.ensure_future(writer.wait_closed()).add_done_callback(
+        lambda _: connected_clients.pop(client_id, None)
+    )
 
     # Get or create session for this TCP client
     session = record_inbound_session(
@@ -138,62 +216,87 @@ async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWrit
     )
 
     try:
+        buf = bytearray()
         while True:
-            # Read message (newline-delimited JSON)
-            data = await reader.readline()
-            if not data:
+            # Read a batch of data; one await can carry many messages
+            chunk = await reader.read(65536)
+            if not chunk:
                 break
-
-            try:
-                request = json.loads(data.decode().strip())
-                command = request.get("command", "chat")
-                message = request.get("message", "")
-
-                if command == "chat":
-                    # Run agent with session history
-                    response, updated_history = await run_agent_with_history(
-                        message, session.history
-                    )
-                    session.history = updated_history
-                    session_manager.update(session)
-
-                    # Reload scheduler jobs in case new ones were created
-                    if scheduler:
-                        scheduler.reload_jobs()
-
-                    reply = {"status": "ok", "response": response}
-
-                elif command == "clear":
-                    session.clear_history()
-                    session_manager.update(session)
-                    reply = {"status": "ok", "response": "Conversation cleared."}
-
-                elif command == "ping":
-                    reply = {"status": "ok", "response": "pong"}
-
-                else:
-                    reply = {
-                        "status": "error",
-                        "response": f"Unknown command: {command}",
-                    }
-
-            except json.JSONDecodeError:
-                reply = {"status": "error", "response": "Invalid JSON"}
-            except Exception as e:
-                logger.exception("Error processing client request")
-                reply = {"status": "error", "response": str(e)}
-
-            # Send response
-            response_data = json.dumps(reply) + "\n"
-            writer.write(response_data.encode())
+            buf += chunk
+
+            # Split complete newline-delimited JSON frames
+            while (nl := buf.find(b"\n")) >= 0:
+                data = bytes(buf[:nl])
+                del buf[: nl + 1]
+                data = data.strip()
+                if not data:
+                    continue
+
+                # Fast path: ping health checks skip JSON entirely
+                if data in (
+                    b"PING",
+                    b'{"command": "ping"}',
+                    b'{"command":"ping"}',
+                    b'{"command":"ping","message":""}',
+                ):
+                    writer.write(_PONG_FRAME)
+                    continue
+
+                try:
+                    request = json.loads(data)
+                    command = request.get("command", "chat")
+                    message = request.get("message", "")
+
+                    if command == "chat":
+                        if scheduler:
+                            scheduler.record_activity()
+
+                        # Run agent with session history (via worker pool)
+                        response, updated_history = await run_agent_queued(
+                            message, session.history
+                        )
+                        session.history = updated_history
+                        session_manager.update(session)
+
+                        # Reload scheduler jobs only if a tool changed them
+                        if scheduler:
+                            scheduler.reload_if_dirty()
+
+                        reply = {"status": "ok", "response": response}
+
+                    elif command == "clear":
+                        session.clear_history()
+                        session_manager.update(session)
+                        reply = {"status": "ok", "response": "Conversation cleared."}
+
+                    elif command == "ping":
+                        reply = {"status": "ok", "response": "pong"}
+
+                    else:
+                        reply = {
+                            "status": "error",
+                            "response": f"Unknown command: {command}",
+                        }
+
+                except json.JSONDecodeError:
+                    reply = {"status": "error", "response": "Invalid JSON"}
+                except Exception as e:
+                    logger.exception("Error processing client request")
+                    reply = {"status": "error", "response": str(e)}
+
+                # Send response as a length-prefixed frame: the client
+                # reads it with two readexactly calls, no newline scan
+                writer.write(frame_message(orjson.dumps(reply)))
+
+            # One drain per batch of frames
             await writer.drain()
 
     except asyncio.CancelledError:
         pass
     except Exception as e:
-        logger.error(f"Client error: {e}")
+        logger.error("Client error: %s", e)
     finally:
-        logger.info(f"Client disconnected: {client_id}")
+        logger.info("Client disconnected: %s", client_id)
         connected_clients.pop(client_id, None)
         writer.close()
         await writer.wait_closed()
@@ -201,7 +304,17 @@ async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWrit
 
 async def run_tcp_server():
     """Run the local TCP server."""
-    server = await asyncio.start_server(handle_client, SERVER_HOST, SERVER_PORT)
+    try:
+        # Large accept backlog; SO_REUSEPORT lets additional worker
+        # processes bind the same port for kernel-level load balancing.
+        server = await asyncio.start_server(
+            handle_client, SERVER_HOST, SERVER_PORT, backlog=2048, reuse_port=True
+        )
+    except (ValueError, OSError):
+        # SO_REUSEPORT is not available on all platforms
+        server = await asyncio.start_server(
+            handle_client, SERVER_HOST, SERVER_PORT, backlog=2048
+        )
     logger.info(f"TCP server listening on {SERVER_HOST}:{SERVER_PORT}")
 
     async with server:
@@ -265,16 +378,25 @@ async def send_response_with_images(update, response: str):
                 await update.message.reply_text(chunk)
 
     # Send screenshots as photos
+    from pathlib import Path
+
+    from telegram import InputFile
+
     for screenshot_path in screenshots:
         if os.path.exists(screenshot_path):
             try:
-                with open(screenshot_path, "rb") as photo:
-                    await update.message.reply_photo(photo=photo, caption="Screenshot")
+                # Read off-loop so large PNGs don't block the event loop,
+                # and hand telegram the bytes with a known length
+                data = await asyncio.to_thread(Path(screenshot_path).read_bytes)
+                await update.message.reply_photo(
+                    photo=InputFile(data, filename=os.path.basename(screenshot_path)),
+                    caption="Screenshot",
+                )
                 # Clean up temp file
-                os.remove(screenshot_path)
-                logger.info(f"Sent screenshot: {screenshot_path}")
+                await asyncio.to_thread(os.remove, screenshot_path)
+                logger.info("Sent screenshot: %s", screenshot_path)
             except Exception as e:
-                logger.error(f"Failed to send screenshot: {e}")
+                logger.error("Failed to send screenshot: %s", e)
 
 
 async def run_telegram_bot():
@@ -311,6 +433,7 @@ async def run_telegram_bot():
         global scheduler
         if scheduler:
             scheduler.set_chat_id(chat_id)
+            scheduler.record_activity()
 
         # Get or create session for this Telegram chat
         session = record_inbound_session(
@@ -328,7 +451,12 @@ async def run_telegram_bot():
             ),
         )
 
-        await context.bot.send_chat_action(chat_id=chat_id, action="typing")
+        # Fire the typing indicator concurrently; no need to pay a
+        # Telegram round-trip before starting the agent
+        typing_task = asyncio.create_task(
+            context.bot.send_chat_action(chat_id=chat_id, action="typing")
+        )
+        typing_task.add_done_callback(lambda t: t.exception())
 
         try:
             response, updated_history = await run_agent_with_history(
@@ -341,7 +469,7 @@ async def run_telegram_bot():
             await send_response_with_images(update, response)
 
             if scheduler:
-                scheduler.reload_jobs()
+                scheduler.reload_if_dirty()
 
         except Exception as e:
             logger.exception("Error handling message")
@@ -363,9 +491,9 @@ async def run_telegram_bot():
     channel_router.register(TelegramAdapter(telegram_app.bot))
     await telegram_app.updater.start_polling(allowed_updates=Update.ALL_TYPES)
 
-    # Wait until stopped
-    while running:
-        await asyncio.sleep(1)
+    # Wait until stopped (event-based, no polling wakeups)
+    if _shutdown_event:
+        await _shutdown_event.wait()
 
     # Cleanup
     await telegram_app.updater.stop()
@@ -380,7 +508,11 @@ async def run_telegram_bot():
 
 async def async_main():
     """Async main entry point."""
-    global running, scheduler
+    global running, scheduler, _shutdown_event, _agent_queue
+
+    _shutdown_event = asyncio.Event()
+    _agent_queue = asyncio.Queue(maxsize=AGENT_QUEUE_SIZE)
+    worker_tasks = [asyncio.create_task(_agent_worker()) for _ in range(AGENT_WORKERS)]
 
     # Validate OpenAI key (required)
     if not OPENAI_API_KEY:
@@ -422,6 +554,8 @@ async def async_main():
     def signal_handler():
         global running
         running = False
+        if _shutdown_event:
+            _shutdown_event.set()
         logger.info("Shutting down...")
 
     loop = asyncio.get_event_loop()
@@ -434,6 +568,8 @@ async def async_main():
     except asyncio.CancelledError:
         pass
     finally:
+        for task in worker_tasks:
+            task.cancel()
         scheduler.stop()
         logger.info("SquidBot server stopped")
 
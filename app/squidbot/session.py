@@ -5,16 +5,24 @@ Supports multiple channels: Telegram, WhatsApp, Discord, TCP, etc.
 Uses JSONL format for session transcripts (one JSON object per line).
 """
 
-import json
+import atexit
+import gzip
 import logging
+import os
+import shutil
+import threading
 import time
 import uuid
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Iterator
 
+import msgspec
+import orjson
+
 from .config import DATA_DIR
 from .lanes import CommandLane
 
@@ -23,6 +31,35 @@ logger = logging.getLogger(__name__)
 # Session format version
 SESSION_VERSION = 1
 
+# How often the background flusher fsyncs dirty transcripts (seconds)
+FLUSH_INTERVAL = 0.05
+
+# Active transcript size that triggers rotation to a gzipped segment
+ROTATE_THRESHOLD = 16 * 1024 * 1024
+
+# Single-pass translation table for filesystem-safe path components
+_PATH_SAFE_TBL = str.maketrans({"/": "_", ":": "_"})
+
+# Cached per-second ISO timestamp prefix for _iso_now
+_iso_cache: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """ISO-8601 timestamp; caches the per-second prefix.
+
+    datetime.now().isoformat() costs a few microseconds per call, which
+    adds up on the per-message append path. Only the sub-second part
+    needs formatting on every call.
+    """
+    global _iso_cache
+    ns = time.time_ns()
+    sec = ns // 1_000_000_000
+    cached_sec, prefix = _iso_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec).isoformat()
+        _iso_cache = (sec, prefix)
+    return f"{prefix}.{(ns % 1_000_000_000) // 1000:06d}"
+
 
 class ChannelType(str, Enum):
     """Supported messaging channels."""
@@ -41,39 +78,50 @@ class ChannelType(str, Enum):
     @property
     def supports_media(self) -> bool:
         """Whether this channel supports media messages."""
-        return self in (
-            ChannelType.TELEGRAM,
-            ChannelType.WHATSAPP,
-            ChannelType.DISCORD,
-            ChannelType.SLACK,
-            ChannelType.WEB,
-        )
+        return self in _MEDIA_CHANNELS
 
     @property
     def supports_reactions(self) -> bool:
         """Whether this channel supports message reactions."""
-        return self in (
-            ChannelType.TELEGRAM,
-            ChannelType.DISCORD,
-            ChannelType.SLACK,
-        )
+        return self in _REACTION_CHANNELS
 
     @property
     def max_message_length(self) -> int:
         """Maximum message length for this channel."""
-        limits = {
-            ChannelType.TELEGRAM: 4096,
-            ChannelType.WHATSAPP: 4096,
-            ChannelType.DISCORD: 2000,
-            ChannelType.SLACK: 40000,
-            ChannelType.TCP: 0,  # No limit
-            ChannelType.WEB: 0,  # No limit
-            ChannelType.API: 0,  # No limit
-        }
-        return limits.get(self, 4096)
-
-
-@dataclass
+        return _MAX_MESSAGE_LENGTH.get(self, 4096)
+
+
+# Channel capability lookups, built once (properties above are hot paths)
+_MEDIA_CHANNELS = frozenset(
+    {
+        ChannelType.TELEGRAM,
+        ChannelType.WHATSAPP,
+        ChannelType.DISCORD,
+        ChannelType.SLACK,
+        ChannelType.WEB,
+    }
+)
+
+_REACTION_CHANNELS = frozenset(
+    {
+        ChannelType.TELEGRAM,
+        ChannelType.DISCORD,
+        ChannelType.SLACK,
+    }
+)
+
+_MAX_MESSAGE_LENGTH = {
+    ChannelType.TELEGRAM: 4096,
+    ChannelType.WHATSAPP: 4096,
+    ChannelType.DISCORD: 2000,
+    ChannelType.SLACK: 40000,
+    ChannelType.TCP: 0,  # No limit
+    ChannelType.WEB: 0,  # No limit
+    ChannelType.API: 0,  # No limit
+}
+
+
+@dataclass(slots=True)
 class DeliveryContext:
     """Context for message delivery routing."""
 
@@ -86,7 +134,7 @@ class DeliveryContext:
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "channel": str(self.channel),
+            "channel": self.channel.value,
             "recipient_id": self.recipient_id,
             "account_id": self.account_id,
             "thread_id": self.thread_id,
@@ -96,17 +144,11 @@ class DeliveryContext:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DeliveryContext":
-        return cls(
-            channel=ChannelType(data["channel"]),
-            recipient_id=data["recipient_id"],
-            account_id=data.get("account_id"),
-            thread_id=data.get("thread_id"),
-            guild_id=data.get("guild_id"),
-            metadata=data.get("metadata", {}),
-        )
+        # C-level field resolution and enum validation in one call
+        return msgspec.convert(data, cls, strict=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionEntry:
     """Session metadata stored in sessions.json index."""
 
@@ -127,12 +169,12 @@ class SessionEntry:
         return {
             "session_id": self.session_id,
             "session_key": self.session_key,
-            "channel": str(self.channel),
+            "channel": self.channel.value,
             "recipient_id": self.recipient_id,
             "transcript_file": self.transcript_file,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
-            "last_lane": str(self.last_lane),
+            "last_lane": self.last_lane.value,
             "delivery_context": (
                 self.delivery_context.to_dict() if self.delivery_context else None
             ),
@@ -143,26 +185,16 @@ class SessionEntry:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SessionEntry":
-        delivery_ctx = data.get("delivery_context")
-        return cls(
-            session_id=data["session_id"],
-            session_key=data["session_key"],
-            channel=ChannelType(data["channel"]),
-            recipient_id=data["recipient_id"],
-            transcript_file=data["transcript_file"],
-            created_at=data.get("created_at", time.time()),
-            updated_at=data.get("updated_at", time.time()),
-            last_lane=CommandLane(data.get("last_lane", "main")),
-            delivery_context=(
-                DeliveryContext.from_dict(delivery_ctx) if delivery_ctx else None
-            ),
-            metadata=data.get("metadata", {}),
-            message_count=data.get("message_count", 0),
-            display_name=data.get("display_name"),
-        )
+        # Timestamps are required fields; backfill only for legacy records
+        if "created_at" not in data or "updated_at" not in data:
+            now = time.time()
+            data = {"created_at": now, "updated_at": now, **data}
+        # msgspec.convert resolves fields, enums, and the nested
+        # DeliveryContext at C level — much faster than kwarg-by-kwarg
+        return msgspec.convert(data, cls, strict=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptMessage:
     """A single message in a session transcript."""
 
@@ -183,39 +215,164 @@ class TranscriptMessage:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TranscriptMessage":
-        return cls(
-            type=data.get("type", "message"),
-            role=data["role"],
-            content=data["content"],
-            timestamp=data.get("timestamp", datetime.now().isoformat()),
-            metadata=data.get("metadata", {}),
-        )
+        if "timestamp" not in data or "type" not in data:
+            data = {"type": "message", "timestamp": _iso_now(), **data}
+        return msgspec.convert(data, cls, strict=False)
+
+
+class _HistoryLine(msgspec.Struct):
+    """Projection of a transcript line: only the fields get_history needs."""
+
+    type: str = "message"
+    role: str = ""
+    content: str = ""
+
+
+# msgspec decodes bytes at C speed and skips all other fields without
+# allocating them (metadata, timestamps, tool payloads)
+_HISTORY_DECODER = msgspec.json.Decoder(_HistoryLine)
 
 
 class SessionTranscript:
     """JSONL-based session transcript."""
 
+    # Paths whose header is known to exist; skips a stat per instantiation
+    _initialized_paths: set[Path] = set()
+
     def __init__(self, file_path: Path, session_id: str | None = None):
         self.file_path = file_path
         self.session_id = session_id or str(uuid.uuid4())
+        self._fh = None
+        # Serializes writers sharing this transcript (no torn JSONL lines)
+        self._lock = threading.Lock()
+        # Set on append, cleared on fsync; lets the flusher skip idle files
+        self._needs_sync = False
+        # Rotated segment paths; only rotate()/clear() change them in-process
+        self._segments_cache: list[Path] | None = None
+        # Parsed history cache keyed by (st_size, st_mtime_ns, segment count)
+        self._history_cache: tuple[tuple[int, int, int], list[dict]] | None = None
         self._ensure_header()
 
     def _ensure_header(self) -> None:
         """Ensure transcript has a header line."""
+        if self.file_path in SessionTranscript._initialized_paths:
+            return
         if not self.file_path.exists():
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
             header = {
                 "type": "session",
                 "version": SESSION_VERSION,
                 "id": self.session_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
             }
             self._append_line(header)
+        SessionTranscript._initialized_paths.add(self.file_path)
+
+    def _open(self):
+        """Get the persistent append handle, opening it if needed."""
+        if self._fh is None or self._fh.closed:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unbuffered append handle: one write syscall per batch, and
+            # bytes are immediately visible to other readers of the file
+            self._fh = open(self.file_path, "ab", buffering=0)
+        return self._fh
 
     def _append_line(self, data: dict) -> None:
         """Append a JSON line to the transcript."""
-        with open(self.file_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(data, ensure_ascii=False) + "\n")
+        self._append_lines([data])
+
+    def _append_lines(self, lines: list[dict]) -> None:
+        """Append multiple JSON lines with a single write."""
+        buf = bytearray()
+        for data in lines:
+            buf += orjson.dumps(data)
+            buf += b"\n"
+        with self._lock:
+            fh = self._open()
+            fh.write(bytes(buf))
+            self._history_cache = None
+            self._needs_sync = True
+            if fh.tell() >= ROTATE_THRESHOLD:
+                self._rotate_locked()
+
+    def _segments(self) -> list[Path]:
+        """Rotated (immutable) transcript segments, oldest first."""
+        if self._segments_cache is None:
+            prefix = self.file_path.name + "."
+            numbered = []
+            for path in self.file_path.parent.glob(prefix + "*"):
+                suffix = path.name[len(prefix) :]
+                if suffix.endswith(".gz"):
+                    suffix = suffix[:-3]
+                try:
+                    numbered.append((int(suffix), path))
+                except ValueError:
+                    continue
+            numbered.sort()
+            self._segments_cache = [path for _, path in numbered]
+        return self._segments_cache
+
+    def rotate(self) -> None:
+        """Rotate the active transcript into a gzipped segment."""
+        with self._lock:
+            self._rotate_locked()
+
+    def _rotate_locked(self) -> None:
+        """Close, compress, and restart the active file (lock held)."""
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
+        self._fh = None
+
+        rotated = self.file_path.with_name(
+            f"{self.file_path.name}.{len(self._segments()) + 1}"
+        )
+        self.file_path.rename(rotated)
+        with open(rotated, "rb") as src:
+            with gzip.open(f"{rotated}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        rotated.unlink()
+
+        self._segments_cache = None
+        self._history_cache = None
+        SessionTranscript._initialized_paths.discard(self.file_path)
+
+        # Fresh active file with its own header line (written directly;
+        # _append_line would deadlock on the non-reentrant lock)
+        header = {
+            "type": "session",
+            "version": SESSION_VERSION,
+            "id": self.session_id,
+            "timestamp": _iso_now(),
+        }
+        self._open().write(orjson.dumps(header) + b"\n")
+        SessionTranscript._initialized_paths.add(self.file_path)
+        self._needs_sync = True
+
+    def flush(self, sync: bool = False) -> None:
+        """Force appended data to disk (fsync when sync=True)."""
+        with self._lock:
+            if sync and self._fh is not None and not self._fh.closed:
+                os.fsync(self._fh.fileno())
+                self._needs_sync = False
+
+    def sync_if_dirty(self) -> None:
+        """Fsync only if data was appended since the last sync."""
+        with self._lock:
+            if self._needs_sync and self._fh is not None and not self._fh.closed:
+                os.fsync(self._fh.fileno())
+                self._needs_sync = False
+
+    def close(self) -> None:
+        """Close the persistent append handle."""
+        with self._lock:
+            if self._fh is not None and not self._fh.closed:
+                self._fh.close()
+            self._fh = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def append_message(
         self,
@@ -225,14 +382,34 @@ class SessionTranscript:
         metadata: dict | None = None,
     ) -> None:
         """Append a message to the transcript."""
-        msg = TranscriptMessage(
-            type=msg_type,
-            role=role,
-            content=content,
-            timestamp=datetime.now().isoformat(),
-            metadata=metadata or {},
+        # Build the dict literal directly; wrapping in a TranscriptMessage
+        # just to call to_dict() is pure overhead on this hot path
+        self._append_line(
+            {
+                "type": msg_type,
+                "role": role,
+                "content": content,
+                "timestamp": _iso_now(),
+                "metadata": metadata or {},
+            }
+        )
+
+    def append_messages(self, messages: list[tuple[str, str]]) -> None:
+        """Append many (role, content) messages with a single write."""
+        if not messages:
+            return
+        self._append_lines(
+            [
+                {
+                    "type": "message",
+                    "role": role,
+                    "content": content,
+                    "timestamp": _iso_now(),
+                    "metadata": {},
+                }
+                for role, content in messages
+            ]
         )
-        self._append_line(msg.to_dict())
 
     def append_user_message(self, content: str, metadata: dict | None = None) -> None:
         """Append a user message."""
@@ -253,7 +430,7 @@ class SessionTranscript:
                 "type": "tool_call",
                 "tool": tool_name,
                 "input": tool_input,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "metadata": metadata or {},
             }
         )
@@ -267,42 +444,73 @@ class SessionTranscript:
                 "type": "tool_result",
                 "tool": tool_name,
                 "result": result,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "metadata": metadata or {},
             }
         )
 
     def read_messages(self) -> Iterator[dict]:
         """Read all messages from transcript (excluding header)."""
-        if not self.file_path.exists():
-            return
-
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    if data.get("type") != "session":  # Skip header
-                        yield data
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON line in transcript: {line[:50]}...")
+        paths = list(self._segments())
+        if self.file_path.exists():
+            paths.append(self.file_path)
+
+        # Binary mode: UTF-8 decoding happens once inside orjson rather
+        # than per-line in Python, and no str.strip() copies are made
+        for path in paths:
+            opener = gzip.open if path.suffix == ".gz" else open
+            with opener(path, "rb") as f:
+                for line in f:
+                    if line == b"\n":
+                        continue
+                    try:
+                        data = orjson.loads(line)
+                        if data.get("type") != "session":  # Skip header
+                            yield data
+                    except orjson.JSONDecodeError:
+                        logger.warning(
+                            f"Invalid JSON line in transcript: {line[:50]}..."
+                        )
 
     def get_history(self, limit: int | None = None) -> list[dict]:
         """Get conversation history as list of message dicts."""
-        messages = []
-        for msg in self.read_messages():
-            if msg.get("type") == "message":
-                messages.append(
-                    {
-                        "role": msg["role"],
-                        "content": msg["content"],
-                    }
-                )
+        segments = self._segments()
+        try:
+            st = os.stat(self.file_path)
+            key = (st.st_size, st.st_mtime_ns, len(segments))
+        except OSError:
+            key = None
+
+        if self._history_cache is not None and self._history_cache[0] == key:
+            messages = self._history_cache[1]
+        else:
+            messages = []
+            if key is not None:
+                paths = list(segments)
+                paths.append(self.file_path)
+                for path in paths:
+                    opener = gzip.open if path.suffix == ".gz" else open
+                    with opener(path, "rb") as f:
+                        for line in f:
+                            if line == b"\n":
+                                continue
+                            try:
+                                h = _HISTORY_DECODER.decode(line)
+                            except msgspec.DecodeError:
+                                logger.warning(
+                                    f"Invalid JSON line in transcript: {line[:50]}..."
+                                )
+                                continue
+                            if h.type == "message":
+                                messages.append(
+                                    {"role": h.role, "content": h.content}
+                                )
+                self._history_cache = (key, messages)
+
         if limit:
-            messages = messages[-limit:]
-        return messages
+            return messages[-limit:]
+        # Return a copy so callers can't mutate the cached list
+        return list(messages)
 
     def get_full_history(self) -> list[dict]:
         """Get full transcript including tool calls."""
@@ -310,20 +518,22 @@ class SessionTranscript:
 
     def count_messages(self) -> int:
         """Count messages in transcript."""
-        count = 0
-        for msg in self.read_messages():
-            if msg.get("type") == "message":
-                count += 1
-        return count
+        return len(self.get_history())
 
     def clear(self) -> None:
         """Clear transcript and write new header."""
+        self.close()
+        self._history_cache = None
+        SessionTranscript._initialized_paths.discard(self.file_path)
+        for segment in self._segments():
+            segment.unlink(missing_ok=True)
+        self._segments_cache = None
         if self.file_path.exists():
             self.file_path.unlink()
         self._ensure_header()
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Session representing a conversation context."""
 
@@ -355,11 +565,9 @@ class Session:
     def history(self, value: list[dict]) -> None:
         """Set history by clearing and rewriting transcript."""
         self.transcript.clear()
-        for msg in value:
-            self.transcript.append_message(
-                role=msg["role"],
-                content=msg["content"],
-            )
+        self.transcript.append_messages(
+            [(msg["role"], msg["content"]) for msg in value]
+        )
         self.entry.message_count = len(value)
 
     @property
@@ -381,7 +589,7 @@ class Session:
     @classmethod
     def create_key(cls, channel: ChannelType, recipient_id: str) -> str:
         """Generate a unique session key."""
-        return f"{channel}:{recipient_id}"
+        return f"{channel.value}:{recipient_id}"
 
     def touch(self) -> None:
         """Update the session timestamp."""
@@ -393,6 +601,14 @@ class Session:
         self.entry.message_count += 1
         self.touch()
 
+    def add_messages(self, messages: list[tuple[str, str]]) -> None:
+        """Add many (role, content) messages with one write and one touch."""
+        if not messages:
+            return
+        self.transcript.append_messages(messages)
+        self.entry.message_count += len(messages)
+        self.touch()
+
     def clear_history(self) -> None:
         """Clear conversation history."""
         self.transcript.clear()
@@ -413,39 +629,182 @@ class SessionManager:
     def __init__(self, store_path: Path | None = None):
         self.store_path = store_path or DATA_DIR / "sessions"
         self.store_path.mkdir(parents=True, exist_ok=True)
-        self._index_file = self.store_path / "sessions.json"
+        self._index_file = self.store_path / "sessions.jsonl"
+        self._legacy_index_file = self.store_path / "sessions.json"
         self._sessions: dict[str, Session] = {}
         self._entries: dict[str, SessionEntry] = {}
+        # Raw index records not yet parsed into SessionEntry objects
+        self._pending: dict[str, dict] = {}
+        # Secondary index: channel -> session keys (avoids O(N) filters)
+        self._by_channel: dict[ChannelType, set[str]] = defaultdict(set)
+        self._index_fh = None
+        self._index_lines = 0
+        # Guards _entries/_pending/_by_channel and the index log; RLock
+        # because mutators nest (_append_index can trigger compaction)
+        self._lock = threading.RLock()
         self._load_index()
+        # Background flusher: appends are write-through, so durability is
+        # the only work left off the hot path — periodic fsync of dirty files
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="session-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        """Periodically fsync transcripts with unsynced appends."""
+        while not self._stop.wait(FLUSH_INTERVAL):
+            with self._lock:
+                transcripts = [s.transcript for s in self._sessions.values()]
+            for transcript in transcripts:
+                try:
+                    transcript.sync_if_dirty()
+                except OSError as e:
+                    logger.warning(f"Transcript fsync failed: {e}")
+
+    def close(self) -> None:
+        """Stop the flusher and durably flush all open transcripts."""
+        self._stop.set()
+        if self._flusher.is_alive():
+            self._flusher.join(timeout=2.0)
+        with self._lock:
+            for session in self._sessions.values():
+                try:
+                    session.transcript.flush(sync=True)
+                    session.transcript.close()
+                except OSError as e:
+                    logger.warning(f"Transcript close failed: {e}")
+            if self._index_fh is not None and not self._index_fh.closed:
+                self._index_fh.close()
+            self._index_fh = None
 
     def _load_index(self) -> None:
-        """Load session index from sessions.json."""
+        """Load session index by replaying the append-only JSONL log."""
+        if not self._index_file.exists():
+            self._migrate_legacy_index()
         if not self._index_file.exists():
             return
 
         try:
-            data = json.loads(self._index_file.read_text())
+            with open(self._index_file, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self._index_lines += 1
+                    try:
+                        record = orjson.loads(line)
+                        # Later records override earlier ones by key.
+                        # Records stay raw dicts until first access so
+                        # startup doesn't parse sessions never touched
+                        # this run.
+                        if record.get("op") == "delete":
+                            self._pending.pop(record["key"], None)
+                            self._entries.pop(record["key"], None)
+                            for keys in self._by_channel.values():
+                                keys.discard(record["key"])
+                            continue
+                        self._pending[record["session_key"]] = record
+                        self._by_channel[ChannelType(record["channel"])].add(
+                            record["session_key"]
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to load session index record: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load session index: {e}")
+
+    def _migrate_legacy_index(self) -> None:
+        """One-time migration from the old full-rewrite sessions.json."""
+        if not self._legacy_index_file.exists():
+            return
+
+        try:
+            data = orjson.loads(self._legacy_index_file.read_bytes())
             for key, entry_data in data.items():
                 try:
                     entry = SessionEntry.from_dict(entry_data)
                     self._entries[key] = entry
+                    self._by_channel[entry.channel].add(key)
                 except Exception as e:
                     logger.warning(f"Failed to load session entry {key}: {e}")
+            self._compact_index()
+            self._legacy_index_file.rename(
+                self._legacy_index_file.with_suffix(".json.bak")
+            )
+            logger.info("Migrated legacy sessions.json index to sessions.jsonl")
         except Exception as e:
-            logger.error(f"Failed to load session index: {e}")
+            logger.error(f"Failed to migrate legacy session index: {e}")
+
+    def _append_index(self, record: dict) -> None:
+        """Append one mutation record to the JSONL index (O(1) per update)."""
+        try:
+            with self._lock:
+                if self._index_fh is None or self._index_fh.closed:
+                    self._index_fh = open(self._index_file, "ab", buffering=0)
+                self._index_fh.write(orjson.dumps(record) + b"\n")
+                self._index_lines += 1
+                # Compact once stale records dominate the log
+                live = len(self._entries) + len(self._pending)
+                if self._index_lines > max(64, 4 * live):
+                    self._compact_index()
+        except Exception as e:
+            logger.error(f"Failed to append session index record: {e}")
 
-    def _save_index(self) -> None:
-        """Save session index to sessions.json."""
+    def _compact_index(self) -> None:
+        """Rewrite the JSONL index as a fresh snapshot of live entries."""
         try:
-            data = {key: entry.to_dict() for key, entry in self._entries.items()}
-            self._index_file.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+            with self._lock:
+                self._compact_index_locked()
         except Exception as e:
-            logger.error(f"Failed to save session index: {e}")
+            logger.error(f"Failed to compact session index: {e}")
+
+    def _compact_index_locked(self) -> None:
+        if self._index_fh is not None and not self._index_fh.closed:
+            self._index_fh.close()
+        self._index_fh = None
+
+        tmp = self._index_file.with_suffix(".jsonl.tmp")
+        with open(tmp, "wb") as f:
+            for record in self._pending.values():
+                f.write(orjson.dumps(record) + b"\n")
+            for entry in self._entries.values():
+                f.write(orjson.dumps(entry.to_dict()) + b"\n")
+            # Make the snapshot durable before it replaces the log;
+            # the rename itself is atomic, so a crash leaves either
+            # the old or the new index, never a torn one
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._index_file)
+        self._index_lines = len(self._entries) + len(self._pending)
+
+    def _materialize(self, session_key: str) -> SessionEntry | None:
+        """Parse a pending raw index record into a SessionEntry on demand."""
+        with self._lock:
+            if session_key in self._entries:
+                return self._entries[session_key]
+
+            record = self._pending.pop(session_key, None)
+            if record is None:
+                return None
+
+            try:
+                entry = SessionEntry.from_dict(record)
+            except Exception as e:
+                logger.warning(f"Failed to load session entry {session_key}: {e}")
+                return None
+
+            self._entries[session_key] = entry
+            return entry
+
+    def _materialize_all(self) -> None:
+        """Materialize every pending index record (for iteration paths)."""
+        for key in list(self._pending):
+            self._materialize(key)
 
     def _transcript_path(self, session_id: str, thread_id: str | None = None) -> Path:
         """Get transcript file path."""
         if thread_id:
-            safe_thread = str(thread_id).replace("/", "_").replace(":", "_")
+            safe_thread = str(thread_id).translate(_PATH_SAFE_TBL)
             filename = f"{session_id}-thread-{safe_thread}.jsonl"
         else:
             filename = f"{session_id}.jsonl"
@@ -460,42 +819,44 @@ class SessionManager:
         """Get or create a session."""
         session_key = Session.create_key(channel, recipient_id)
 
-        # Check cache first
-        if session_key in self._sessions:
-            return self._sessions[session_key]
-
-        # Check index
-        if session_key in self._entries:
-            entry = self._entries[session_key]
-            transcript_path = Path(entry.transcript_file)
-            if not transcript_path.is_absolute():
-                transcript_path = self.store_path / transcript_path
-            transcript = SessionTranscript(transcript_path, entry.session_id)
-            session = Session(entry=entry, transcript=transcript)
-            self._sessions[session_key] = session
-            return session
-
-        # Create new
-        if create_if_missing:
-            session_id = str(uuid.uuid4())
-            transcript_path = self._transcript_path(session_id)
-            transcript = SessionTranscript(transcript_path, session_id)
-
-            entry = SessionEntry(
-                session_id=session_id,
-                session_key=session_key,
-                channel=channel,
-                recipient_id=recipient_id,
-                transcript_file=str(transcript_path.relative_to(self.store_path)),
-                created_at=time.time(),
-                updated_at=time.time(),
-            )
+        with self._lock:
+            # Check cache first
+            if session_key in self._sessions:
+                return self._sessions[session_key]
+
+            # Check index (materializes a pending record if needed)
+            entry = self._materialize(session_key)
+            if entry is not None:
+                transcript_path = Path(entry.transcript_file)
+                if not transcript_path.is_absolute():
+                    transcript_path = self.store_path / transcript_path
+                transcript = SessionTranscript(transcript_path, entry.session_id)
+                session = Session(entry=entry, transcript=transcript)
+                self._sessions[session_key] = session
+                return session
+
+            # Create new
+            if create_if_missing:
+                session_id = str(uuid.uuid4())
+                transcript_path = self._transcript_path(session_id)
+                transcript = SessionTranscript(transcript_path, session_id)
+
+                entry = SessionEntry(
+                    session_id=session_id,
+                    session_key=session_key,
+                    channel=channel,
+                    recipient_id=recipient_id,
+                    transcript_file=str(transcript_path.relative_to(self.store_path)),
+                    created_at=time.time(),
+                    updated_at=time.time(),
+                )
 
-            session = Session(entry=entry, transcript=transcript)
-            self._sessions[session_key] = session
-            self._entries[session_key] = entry
-            self._save_index()
-            return session
+                session = Session(entry=entry, transcript=transcript)
+                self._sessions[session_key] = session
+                self._entries[session_key] = entry
+                self._by_channel[channel].add(session_key)
+                self._append_index(entry.to_dict())
+                return session
 
         return None
 
@@ -513,8 +874,8 @@ class SessionManager:
         if session_key in self._sessions:
             return self._sessions[session_key]
 
-        if session_key in self._entries:
-            entry = self._entries[session_key]
+        entry = self._materialize(session_key)
+        if entry is not None:
             return self.get(entry.channel, entry.recipient_id, create_if_missing=False)
 
         return None
@@ -522,26 +883,31 @@ class SessionManager:
     def update(self, session: Session) -> None:
         """Update a session."""
         session.touch()
-        self._sessions[session.session_key] = session
-        self._entries[session.session_key] = session.entry
-        self._save_index()
+        with self._lock:
+            self._sessions[session.session_key] = session
+            self._entries[session.session_key] = session.entry
+            self._append_index(session.entry.to_dict())
 
     def delete(self, session_key: str) -> bool:
         """Delete a session."""
-        if session_key not in self._entries:
-            return False
-
-        entry = self._entries[session_key]
-
-        # Delete transcript file
-        transcript_path = self.store_path / entry.transcript_file
-        if transcript_path.exists():
-            transcript_path.unlink()
-
-        # Remove from caches
-        self._sessions.pop(session_key, None)
-        del self._entries[session_key]
-        self._save_index()
+        with self._lock:
+            entry = self._materialize(session_key)
+            if entry is None:
+                return False
+
+            # Delete transcript file and any rotated segments
+            transcript_path = self.store_path / entry.transcript_file
+            if transcript_path.exists():
+                transcript_path.unlink()
+            for segment in transcript_path.parent.glob(transcript_path.name + ".*"):
+                segment.unlink(missing_ok=True)
+            SessionTranscript._initialized_paths.discard(transcript_path)
+
+            # Remove from caches
+            self._sessions.pop(session_key, None)
+            self._entries.pop(session_key, None)
+            self._by_channel[entry.channel].discard(session_key)
+            self._append_index({"op": "delete", "key": session_key})
 
         return True
 
@@ -550,10 +916,14 @@ class SessionManager:
         channel: ChannelType | None = None,
     ) -> list[Session]:
         """List all sessions, optionally filtered by channel."""
+        if channel is not None:
+            keys = list(self._by_channel.get(channel, ()))
+        else:
+            self._materialize_all()
+            keys = list(self._entries.keys())
+
         sessions = []
-        for key, entry in self._entries.items():
-            if channel and entry.channel != channel:
-                continue
+        for key in keys:
             session = self.get_by_key(key)
             if session:
                 sessions.append(session)
@@ -564,17 +934,27 @@ class SessionManager:
         channel: ChannelType | None = None,
     ) -> list[DeliveryContext]:
         """Get all active delivery contexts for broadcasting."""
+        # Read straight from the index entries: no Session/transcript
+        # construction (and no header stat) just to pull two fields
+        if channel is not None:
+            entries = [
+                e
+                for e in (self._materialize(k) for k in self._by_channel.get(channel, ()))
+                if e is not None
+            ]
+        else:
+            self._materialize_all()
+            entries = list(self._entries.values())
+
         contexts = []
-        for session in self.list_sessions(channel):
-            if session.delivery_context:
-                contexts.append(session.delivery_context)
-            else:
-                contexts.append(
-                    DeliveryContext(
-                        channel=session.channel,
-                        recipient_id=session.recipient_id,
-                    )
+        for entry in entries:
+            contexts.append(
+                entry.delivery_context
+                or DeliveryContext(
+                    channel=entry.channel,
+                    recipient_id=entry.recipient_id,
                 )
+            )
         return contexts
 
 
@@ -587,9 +967,25 @@ def get_session_manager() -> SessionManager:
     global _session_manager
     if _session_manager is None:
         _session_manager = SessionManager()
+        atexit.register(_session_manager.close)
     return _session_manager
 
 
+def pretty_print_index(store_path: Path | None = None) -> None:
+    """Debug helper: pretty-print the live session index to stdout.
+
+    The on-disk index is compact machine-read JSONL; run
+    ``python -m squidbot.session [store_path]`` when a human-readable
+    view is needed.
+    """
+    import json
+
+    manager = SessionManager(store_path)
+    manager._materialize_all()
+    data = {key: entry.to_dict() for key, entry in manager._entries.items()}
+    print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
 def record_inbound_session(
     channel: ChannelType,
     recipient_id: str,
@@ -607,3 +1003,9 @@ def record_inbound_session(
         manager.update(session)
 
     return session
+
+
+if __name__ == "__main__":
+    import sys
+
+    pretty_print_index(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -1,16 +1,30 @@
 """Skills system - load markdown prompts to teach agent behaviors."""
 
 import asyncio
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import aiofiles
-
 from .config import DATA_DIR
 
 SKILLS_DIR = DATA_DIR / "skills"
 
+# Cap on concurrent skill-file reads so a large skills directory does
+# not flood the shared default executor at startup
+SKILL_LOAD_CONCURRENCY = 16
+
+
+def _read_text_sync(path: Path) -> str:
+    """Read a file in one thread hop (open+read+close in a single callable)."""
+    return path.read_text(encoding="utf-8")
+
+
+def _write_text_sync(path: Path, content: str) -> None:
+    """Write a file in one thread hop."""
+    path.write_text(content, encoding="utf-8")
+
 
 @dataclass
 class Skill:
@@ -23,39 +37,37 @@ class Skill:
     metadata: dict
 
 
-def parse_frontmatter(content: str) -> tuple[dict, str]:
-    """Parse YAML frontmatter from markdown content."""
-    metadata = {}
-    body = content
+# Frontmatter delimiters and key: value lines, matched in single passes
+_FM_RE = re.compile(r"\A---\n(.*?)\n?---\n(.*)", re.DOTALL)
+_KV_RE = re.compile(r"^([^:\n]+):\s*(.*)$", re.MULTILINE)
 
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = parts[1].strip()
-            body = parts[2].strip()
 
-            for line in frontmatter.split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    metadata[key.strip()] = value.strip()
+def parse_frontmatter(content: str) -> tuple[dict, str]:
+    """Parse YAML frontmatter from markdown content."""
+    m = _FM_RE.match(content)
+    if not m:
+        return {}, content
 
-    return metadata, body
+    frontmatter, body = m.group(1), m.group(2)
+    metadata = {k.strip(): v.strip() for k, v in _KV_RE.findall(frontmatter)}
+    return metadata, body.strip()
 
 
 async def load_skill(skill_dir: Path) -> Optional[Skill]:
     """Load a skill from a directory containing SKILL.md."""
-    skill_file = skill_dir / "SKILL.md"
-    if not skill_file.exists():
-        skill_file = skill_dir / "skill.md"
-        if not skill_file.exists():
+    skill_dir = Path(skill_dir)
+    # Open directly and let the miss raise: one syscall instead of an
+    # exists() probe followed by the open
+    for name in ("SKILL.md", "skill.md"):
+        skill_file = skill_dir / name
+        try:
+            content = await asyncio.to_thread(_read_text_sync, skill_file)
+        except FileNotFoundError:
+            continue
+        except Exception:
             return None
 
-    try:
-        async with aiofiles.open(skill_file, "r", encoding="utf-8") as f:
-            content = await f.read()
-
         metadata, body = parse_frontmatter(content)
-
         return Skill(
             name=metadata.get("name", skill_dir.name),
             description=metadata.get("description", ""),
@@ -63,8 +75,7 @@ async def load_skill(skill_dir: Path) -> Optional[Skill]:
             file_path=skill_file,
             metadata=metadata,
         )
-    except Exception:
-        return None
+    return None
 
 
 async def load_all_skills(skills_dir: Path = None) -> list[Skill]:
@@ -72,14 +83,22 @@ async def load_all_skills(skills_dir: Path = None) -> list[Skill]:
     if skills_dir is None:
         skills_dir = SKILLS_DIR
 
-    if not skills_dir.exists():
-        return []
+    # Load skills concurrently; scandir reports is_dir from the cached
+    # stat, avoiding a per-entry syscall
+    sem = asyncio.Semaphore(SKILL_LOAD_CONCURRENCY)
+
+    async def _load(skill_dir: Path) -> Optional[Skill]:
+        async with sem:
+            return await load_skill(skill_dir)
 
-    # Load skills concurrently
     tasks = []
-    for item in skills_dir.iterdir():
-        if item.is_dir():
-            tasks.append(load_skill(item))
+    try:
+        with os.scandir(skills_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    tasks.append(_load(Path(entry.path)))
+    except OSError:
+        return []
 
     results = await asyncio.gather(*tasks)
     return [s for s in results if s is not None]
@@ -90,26 +109,67 @@ def format_skills_for_prompt(skills: list[Skill]) -> str:
     if not skills:
         return ""
 
-    lines = ["## Available Skills\n"]
-    for skill in skills:
-        lines.append(f"### {skill.name}")
-        if skill.description:
-            lines.append(f"*{skill.description}*\n")
-        lines.append(skill.content)
-        lines.append("")
+    # One block per skill, one join: no per-line list building
+    return "## Available Skills\n\n" + "\n".join(
+        f"### {s.name}\n"
+        + (f"*{s.description}*\n\n" if s.description else "")
+        + s.content
+        + "\n"
+        for s in skills
+    )
+
 
-    return "\n".join(lines)
+# Formatted skills prompt keyed by a signature of the skill file mtimes.
+# A stable cached string also keeps the system prompt byte-identical
+# across turns, preserving provider-side prompt caching.
+_skills_cache: tuple[int, str] | None = None
+
+
+def _skills_signature(skills_dir: Path) -> int:
+    """Signature of the skills directory based on skill file mtimes."""
+    entries = []
+    try:
+        with os.scandir(skills_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                mtime = 0
+                for name in ("SKILL.md", "skill.md"):
+                    try:
+                        mtime = os.stat(os.path.join(entry.path, name)).st_mtime_ns
+                        break
+                    except OSError:
+                        continue
+                entries.append((entry.name, mtime))
+    except OSError:
+        return 0
+    entries.sort()
+    return hash(tuple(entries))
 
 
 async def get_skills_context() -> str:
     """Get all skills formatted for system prompt."""
+    global _skills_cache
+    sig = _skills_signature(SKILLS_DIR)
+    if _skills_cache is not None and _skills_cache[0] == sig:
+        return _skills_cache[1]
+
     skills = await load_all_skills()
-    return format_skills_for_prompt(skills)
+    formatted = format_skills_for_prompt(skills)
+    _skills_cache = (sig, formatted)
+    return formatted
+
+
+# One-shot guard: the directory only needs creating once per process
+_skills_dir_ready = False
 
 
 async def ensure_skills_dir():
     """Ensure skills directory exists."""
-    SKILLS_DIR.mkdir(parents=True, exist_ok=True)
+    global _skills_dir_ready
+    if not _skills_dir_ready:
+        SKILLS_DIR.mkdir(parents=True, exist_ok=True)
+        _skills_dir_ready = True
 
 
 async def create_example_skill():
@@ -137,5 +197,4 @@ User: "What's the weather in Tokyo?"
 → Search: "weather in Tokyo today"
 → Response: "It's currently 18°C in Tokyo with partly cloudy skies..."
 """
-    async with aiofiles.open(example_dir / "SKILL.md", "w") as f:
-        await f.write(skill_content)
+    await asyncio.to_thread(_write_text_sync, example_dir / "SKILL.md", skill_content)
@@ -14,8 +14,9 @@ from .web_search import WebSearchTool
 
 logger = logging.getLogger(__name__)
 
-# Core tools (always available)
-CORE_TOOLS: list[Tool] = [
+# Core tools (always available); frozen so shared references can never
+# observe mutation and iteration skips list growth checks
+CORE_TOOLS: tuple[Tool, ...] = (
     # Memory (SQLite + vector search)
     MemoryAddTool(),
     MemorySearchTool(),
@@ -37,16 +38,23 @@ CORE_TOOLS: list[Tool] = [
     CronClearTool(),
     # Coding (Zig + Python)
     *get_coding_tools(),
-]
+)
 
 # Plugin tools (loaded dynamically)
-_plugin_tools: list[Tool] = []
+_plugin_tools: tuple[Tool, ...] = ()
 _plugins_loaded = False
 
+# Serialized OpenAI schemas; the tool set is immutable after plugin
+# load, so this is built once and handed out by reference
+_openai_tools_cache: list[dict] | None = None
+
+# Name -> tool index for O(1) dispatch on the tool-call path
+_tool_index: dict[str, Tool] = {}
+
 
 def _load_plugins() -> None:
     """Load plugins and their tools."""
-    global _plugin_tools, _plugins_loaded
+    global _plugin_tools, _plugins_loaded, _tool_index
 
     if _plugins_loaded:
         return
@@ -59,42 +67,45 @@ def _load_plugins() -> None:
 
         # Get tools from all plugins
         registry = get_registry()
-        _plugin_tools = registry.get_all_tools()
+        _plugin_tools = tuple(registry.get_all_tools())
 
         logger.info(f"Loaded {len(_plugin_tools)} tools from plugins")
 
     except Exception as e:
         logger.warning(f"Failed to load plugins: {e}")
-        _plugin_tools = []
+        _plugin_tools = ()
 
+    _tool_index = {t.name: t for t in CORE_TOOLS + _plugin_tools}
     _plugins_loaded = True
 
 
-def get_all_tools() -> list[Tool]:
+def get_all_tools() -> tuple[Tool, ...]:
     """Get all tools including plugin tools."""
     _load_plugins()
     return CORE_TOOLS + _plugin_tools
 
 
 # Legacy alias for backward compatibility
-ALL_TOOLS = CORE_TOOLS  # Will be updated after first call to get_all_tools()
+ALL_TOOLS = CORE_TOOLS
 
 
 def get_tool_by_name(name: str) -> Tool | None:
     """Get a tool by its name."""
-    for tool in get_all_tools():
-        if tool.name == name:
-            return tool
-    return None
+    _load_plugins()
+    return _tool_index.get(name)
 
 
 def get_openai_tools() -> list[dict]:
     """Get all tools in OpenAI format."""
-    return [tool.to_openai_tool() for tool in get_all_tools()]
+    global _openai_tools_cache
+    if _openai_tools_cache is None:
+        _openai_tools_cache = [tool.to_openai_tool() for tool in get_all_tools()]
+    return _openai_tools_cache
 
 
 def reload_plugins() -> None:
     """Reload all plugins (useful for development)."""
-    global _plugins_loaded
+    global _plugins_loaded, _openai_tools_cache
     _plugins_loaded = False
+    _openai_tools_cache = None
     _load_plugins()
@@ -1,6 +1,7 @@
 """Base tool class and types."""
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any
 
 
@@ -30,8 +31,29 @@ class Tool(ABC):
         """Execute the tool with given parameters."""
         pass
 
-    def to_openai_tool(self) -> dict:
-        """Convert to OpenAI tool format."""
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses that declare name/description/parameters as plain
+        # class attributes get their schema built once at class creation,
+        # shadowing the per-instance cached_property below. Property-based
+        # subclasses (including external plugins) keep the lazy path.
+        resolved = [
+            getattr(cls, attr, None)
+            for attr in ("name", "description", "parameters")
+        ]
+        if all(v is not None and not hasattr(v, "__get__") for v in resolved):
+            cls.openai_tool = {
+                "type": "function",
+                "function": {
+                    "name": resolved[0],
+                    "description": resolved[1],
+                    "parameters": resolved[2],
+                },
+            }
+
+    @cached_property
+    def openai_tool(self) -> dict:
+        """OpenAI tool schema, built once per instance."""
         return {
             "type": "function",
             "function": {
@@ -40,3 +62,7 @@ class Tool(ABC):
                 "parameters": self.parameters,
             },
         }
+
+    def to_openai_tool(self) -> dict:
+        """Convert to OpenAI tool format."""
+        return self.openai_tool
@@ -1,10 +1,15 @@
 """Coding agent tools for Zig and Python with workspace support."""
 
 import asyncio
+import functools
+import json
 import logging
 import os
 import shutil
+import signal
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
@@ -21,23 +26,79 @@ WORKSPACE_DIR = DATA_DIR / "coding"
 Language = Literal["zig", "python"]
 
 
+@functools.lru_cache(maxsize=1)
+def _zig_path() -> str | None:
+    """Locate the zig compiler once; the PATH walk never changes at runtime."""
+    return shutil.which("zig")
+
+
+# Directories already created this session; lets the per-call mkdir
+# (and its stat syscall) be skipped once a directory is known to exist
+_ensured_dirs: set[Path] = set()
+
+
 def get_workspace() -> Path:
     """Get or create the coding workspace directory."""
-    WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
+    if WORKSPACE_DIR not in _ensured_dirs:
+        WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(WORKSPACE_DIR)
     return WORKSPACE_DIR
 
 
 def get_project_dir(project_name: str) -> Path:
     """Get project directory within workspace."""
     project_dir = get_workspace() / project_name
-    project_dir.mkdir(parents=True, exist_ok=True)
+    if project_dir not in _ensured_dirs:
+        project_dir.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(project_dir)
     return project_dir
 
 
+# Dedicated pool for filesystem-bound tool work, so parallel tool calls
+# from one agent turn hit the disk concurrently instead of queueing
+# behind each other on the default executor
+_FS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="coding-fs")
+
+
+async def _run_fs(fn, *args):
+    """Run a blocking filesystem operation on the shared executor."""
+    return await asyncio.get_running_loop().run_in_executor(_FS_EXECUTOR, fn, *args)
+
+
+# Per-stream cap on captured subprocess output; verbose builds or test
+# suites can emit MBs that would otherwise all be buffered
+_OUTPUT_CAP = 1 << 20  # 1 MiB
+
+
+async def _read_stream(stream: asyncio.StreamReader, cap: int = _OUTPUT_CAP) -> str:
+    """Read a subprocess stream into a bounded buffer.
+
+    Keeps draining past the cap (so the child never blocks on a full
+    pipe) but discards the excess and marks the output as truncated.
+    """
+    buf = bytearray()
+    truncated = False
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        if len(buf) < cap:
+            take = cap - len(buf)
+            buf += chunk[:take]
+            truncated = truncated or len(chunk) > take
+        else:
+            truncated = True
+
+    text = buf.decode("utf-8", errors="replace")
+    if truncated:
+        text += "\n... [output truncated at 1 MiB]"
+    return text
+
+
 async def run_command(
     cmd: list[str],
     cwd: Path | None = None,
-    timeout: int = 30,
+    timeout: int | None = 30,
 ) -> tuple[int, str, str]:
     """Run a command asynchronously with timeout."""
     try:
@@ -47,57 +108,216 @@ async def run_command(
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await asyncio.wait_for(
-            process.communicate(),
-            timeout=timeout,
-        )
-        return (
-            process.returncode or 0,
-            stdout.decode("utf-8", errors="replace"),
-            stderr.decode("utf-8", errors="replace"),
-        )
-    except asyncio.TimeoutError:
+        # asyncio.timeout is a single loop-level deadline, cheaper than
+        # the task wrapper + cancel path wait_for sets up per call; it
+        # also collapses to a no-op when no timeout is requested
+        async with asyncio.timeout(timeout):
+            stdout, stderr, _ = await asyncio.gather(
+                _read_stream(process.stdout),
+                _read_stream(process.stderr),
+                process.wait(),
+            )
+        return process.returncode or 0, stdout, stderr
+    except TimeoutError:
         process.kill()
         return -1, "", f"Command timed out after {timeout}s"
     except Exception as e:
         return -1, "", str(e)
 
 
+# Dispatcher script for the persistent Python worker. It reads one JSON
+# request per line, forks a child that runs the target script with the
+# already-warm interpreter, and writes one JSON response per line. Fork
+# skips the ~100ms+ CPython startup that a fresh `python file.py` pays.
+_WORKER_DISPATCHER = r"""
+import json, os, runpy, signal, sys, threading, traceback
+
+CAP = 1 << 20  # 1 MiB per stream, matching run_command
+
+def drain(fd, buf):
+    size = 0
+    truncated = False
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        if size < CAP:
+            take = CAP - size
+            buf.append(chunk[:take])
+            truncated = truncated or len(chunk) > take
+        else:
+            truncated = True
+        size += len(chunk)
+    if truncated:
+        buf.append(b"\n... [output truncated at 1 MiB]")
+
+for line in sys.stdin.buffer:
+    req = json.loads(line)
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(out_r)
+        os.close(err_r)
+        os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+        os.dup2(out_w, 1)
+        os.dup2(err_w, 2)
+        os.chdir(req["cwd"])
+        sys.argv = [req["path"]] + req["args"]
+        if req.get("timeout"):
+            signal.alarm(int(req["timeout"]))
+        code = 0
+        try:
+            runpy.run_path(req["path"], run_name="__main__")
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (1 if e.code else 0)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    os.close(out_w)
+    os.close(err_w)
+    out_buf, err_buf = [], []
+    readers = [
+        threading.Thread(target=drain, args=(out_r, out_buf)),
+        threading.Thread(target=drain, args=(err_r, err_buf)),
+    ]
+    for t in readers:
+        t.start()
+    _, status = os.waitpid(pid, 0)
+    for t in readers:
+        t.join()
+    os.close(out_r)
+    os.close(err_r)
+    resp = {
+        "code": os.waitstatus_to_exitcode(status),
+        "stdout": b"".join(out_buf).decode("utf-8", "replace"),
+        "stderr": b"".join(err_buf).decode("utf-8", "replace"),
+    }
+    sys.stdout.buffer.write((json.dumps(resp) + "\n").encode())
+    sys.stdout.buffer.flush()
+"""
+
+
+class PythonWorker:
+    """Long-lived Python subprocess that runs workspace scripts.
+
+    Each code_run would otherwise fork/exec a fresh interpreter and pay
+    CPython startup before any user code runs. The worker starts once
+    and forks per request, amortizing startup across calls. The worker
+    exits on its own when its stdin pipe closes at shutdown.
+    """
+
+    def __init__(self):
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
+            self._proc = None
+
+    async def run(
+        self,
+        file_path: Path,
+        args: list[str],
+        timeout: int,
+    ) -> tuple[int, str, str]:
+        """Run a Python file through the worker; mirrors run_command."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Streams are bound to the loop that started the worker;
+            # a new loop (tests, restart) needs a fresh process
+            self._kill()
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        async with self._lock:
+            try:
+                if self._proc is None or self._proc.returncode is not None:
+                    self._proc = await asyncio.create_subprocess_exec(
+                        sys.executable,
+                        "-c",
+                        _WORKER_DISPATCHER,
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.DEVNULL,
+                        # One response line carries both capped streams as
+                        # escaped JSON; the 64KB StreamReader default is
+                        # far too small for that
+                        limit=16 * 1024 * 1024,
+                    )
+
+                request = json.dumps(
+                    {
+                        "path": str(file_path),
+                        "args": args,
+                        "cwd": str(file_path.parent),
+                        "timeout": timeout,
+                    }
+                )
+                self._proc.stdin.write(request.encode() + b"\n")
+                await self._proc.stdin.drain()
+
+                # The dispatcher enforces the timeout via SIGALRM in the
+                # forked child; the margin here only covers a hung worker
+                async with asyncio.timeout(timeout + 5):
+                    line = await self._proc.stdout.readline()
+                if not line:
+                    raise RuntimeError("Python worker exited unexpectedly")
+                response = json.loads(line)
+            except TimeoutError:
+                self._kill()
+                return -1, "", f"Command timed out after {timeout}s"
+            except Exception as e:
+                self._kill()
+                return -1, "", str(e)
+
+        code = response["code"]
+        if code == -signal.SIGALRM:
+            return -1, response["stdout"], f"Command timed out after {timeout}s"
+        return code, response["stdout"], response["stderr"]
+
+
+# Forking dispatcher needs POSIX; elsewhere fall back to per-run spawn
+_python_worker: PythonWorker | None = PythonWorker() if os.name == "posix" else None
+
+
 class CodeWriteTool(Tool):
     """Write code to a file in the workspace."""
 
-    @property
-    def name(self) -> str:
-        return "code_write"
+    name = "code_write"
 
-    @property
-    def description(self) -> str:
-        return (
-            "Write code to a file in the coding workspace (.squidbot/coding/). "
-            "Supports Zig (.zig) and Python (.py) files. "
-            "Creates project directories automatically."
-        )
+    description = (
+        "Write code to a file in the coding workspace (.squidbot/coding/). "
+        "Supports Zig (.zig) and Python (.py) files. "
+        "Creates project directories automatically."
+    )
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name (creates subdirectory)",
-                },
-                "filename": {
-                    "type": "string",
-                    "description": "Filename with extension (.zig or .py)",
-                },
-                "code": {
-                    "type": "string",
-                    "description": "The code to write",
-                },
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name (creates subdirectory)",
+            },
+            "filename": {
+                "type": "string",
+                "description": "Filename with extension (.zig or .py)",
+            },
+            "code": {
+                "type": "string",
+                "description": "The code to write",
             },
-            "required": ["project", "filename", "code"],
-        }
+        },
+        "required": ["project", "filename", "code"],
+    }
 
     async def execute(self, project: str, filename: str, code: str) -> str:
         project_dir = get_project_dir(project)
@@ -108,9 +328,9 @@ class CodeWriteTool(Tool):
         if ext not in (".zig", ".py"):
             return f"Error: Unsupported file type '{ext}'. Use .zig or .py"
 
-        # Write file
-        file_path.write_text(code, encoding="utf-8")
-        logger.info(f"Wrote {len(code)} bytes to {file_path}")
+        # Write file off the event loop; large sources would stall it
+        await asyncio.to_thread(file_path.write_text, code, encoding="utf-8")
+        logger.info("Wrote %d bytes to %s", len(code), file_path)
 
         # Try to get relative path, fall back to absolute
         try:
@@ -123,30 +343,24 @@ class CodeWriteTool(Tool):
 class CodeReadTool(Tool):
     """Read code from a file in the workspace."""
 
-    @property
-    def name(self) -> str:
-        return "code_read"
-
-    @property
-    def description(self) -> str:
-        return "Read code from a file in the coding workspace."
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name",
-                },
-                "filename": {
-                    "type": "string",
-                    "description": "Filename to read",
-                },
+    name = "code_read"
+
+    description = "Read code from a file in the coding workspace."
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name",
             },
-            "required": ["project", "filename"],
-        }
+            "filename": {
+                "type": "string",
+                "description": "Filename to read",
+            },
+        },
+        "required": ["project", "filename"],
+    }
 
     async def execute(self, project: str, filename: str) -> str:
         project_dir = get_project_dir(project)
@@ -155,52 +369,46 @@ class CodeReadTool(Tool):
         if not file_path.exists():
             return f"Error: File not found: {filename}"
 
-        code = file_path.read_text(encoding="utf-8")
+        code = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
         return f"```{file_path.suffix[1:]}\n{code}\n```"
 
 
 class CodeRunTool(Tool):
     """Run code in the workspace."""
 
-    @property
-    def name(self) -> str:
-        return "code_run"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Run code in the workspace. "
-            "For Zig: compiles and runs .zig files. "
-            "For Python: executes .py files. "
-            "Returns stdout, stderr, and exit code."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name",
-                },
-                "filename": {
-                    "type": "string",
-                    "description": "Filename to run",
-                },
-                "args": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Command line arguments (optional)",
-                },
-                "timeout": {
-                    "type": "integer",
-                    "description": "Timeout in seconds (default 30)",
-                    "default": 30,
-                },
+    name = "code_run"
+
+    description = (
+        "Run code in the workspace. "
+        "For Zig: compiles and runs .zig files. "
+        "For Python: executes .py files. "
+        "Returns stdout, stderr, and exit code."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name",
+            },
+            "filename": {
+                "type": "string",
+                "description": "Filename to run",
+            },
+            "args": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Command line arguments (optional)",
+            },
+            "timeout": {
+                "type": "integer",
+                "description": "Timeout in seconds (default 30)",
+                "default": 30,
             },
-            "required": ["project", "filename"],
-        }
+        },
+        "required": ["project", "filename"],
+    }
 
     async def execute(
         self,
@@ -233,7 +441,7 @@ class CodeRunTool(Tool):
         timeout: int,
     ) -> str:
         # Check if zig is available
-        zig_path = shutil.which("zig")
+        zig_path = _zig_path()
         if not zig_path:
             return "Error: Zig compiler not found. Please install Zig."
 
@@ -256,13 +464,14 @@ class CodeRunTool(Tool):
         args: list[str],
         timeout: int,
     ) -> str:
-        # Use same Python interpreter
-        import sys
-
-        cmd = [sys.executable, str(file_path)] + args
-        code, stdout, stderr = await run_command(
-            cmd, cwd=file_path.parent, timeout=timeout
-        )
+        if _python_worker is not None:
+            code, stdout, stderr = await _python_worker.run(file_path, args, timeout)
+        else:
+            # Use same Python interpreter
+            cmd = [sys.executable, str(file_path)] + args
+            code, stdout, stderr = await run_command(
+                cmd, cwd=file_path.parent, timeout=timeout
+            )
 
         result = []
         if stdout:
@@ -277,45 +486,51 @@ class CodeRunTool(Tool):
 class CodeListTool(Tool):
     """List files in a project."""
 
-    @property
-    def name(self) -> str:
-        return "code_list"
-
-    @property
-    def description(self) -> str:
-        return "List files in a project or all projects in the workspace."
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name (optional, lists all projects if omitted)",
-                },
+    name = "code_list"
+
+    description = "List files in a project or all projects in the workspace."
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name (optional, lists all projects if omitted)",
             },
-            "required": [],
-        }
+        },
+        "required": [],
+    }
 
     async def execute(self, project: str | None = None) -> str:
+        # The whole listing is directory IO; run it on the fs executor
+        return await _run_fs(self._list, project)
+
+    def _list(self, project: str | None) -> str:
         workspace = get_workspace()
 
+        # scandir walk: directory entries carry cached stat info, so
+        # listing avoids the per-file stat syscalls rglob would make
+        def walk(path: str):
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from walk(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+
         if project:
             project_dir = workspace / project
             if not project_dir.exists():
                 return f"Project '{project}' not found"
 
-            files = sorted(project_dir.rglob("*"))
+            files = sorted(walk(str(project_dir)), key=lambda e: e.path)
             if not files:
                 return f"Project '{project}' is empty"
 
             lines = [f"Files in {project}:"]
-            for f in files:
-                if f.is_file():
-                    rel = f.relative_to(project_dir)
-                    size = f.stat().st_size
-                    lines.append(f"  {rel} ({size} bytes)")
+            for entry in files:
+                rel = os.path.relpath(entry.path, project_dir)
+                lines.append(f"  {rel} ({entry.stat().st_size} bytes)")
             return "\n".join(lines)
         else:
             # List all projects
@@ -325,7 +540,7 @@ class CodeListTool(Tool):
 
             lines = ["Projects:"]
             for p in projects:
-                file_count = len(list(p.rglob("*")))
+                file_count = sum(1 for _ in walk(str(p)))
                 lines.append(f"  {p.name}/ ({file_count} files)")
             return "\n".join(lines)
 
@@ -333,30 +548,24 @@ class CodeListTool(Tool):
 class CodeDeleteTool(Tool):
     """Delete a file or project."""
 
-    @property
-    def name(self) -> str:
-        return "code_delete"
-
-    @property
-    def description(self) -> str:
-        return "Delete a file or entire project from the workspace."
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name",
-                },
-                "filename": {
-                    "type": "string",
-                    "description": "Filename to delete (omit to delete entire project)",
-                },
+    name = "code_delete"
+
+    description = "Delete a file or entire project from the workspace."
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name",
+            },
+            "filename": {
+                "type": "string",
+                "description": "Filename to delete (omit to delete entire project)",
             },
-            "required": ["project"],
-        }
+        },
+        "required": ["project"],
+    }
 
     async def execute(self, project: str, filename: str | None = None) -> str:
         workspace = get_workspace()
@@ -369,53 +578,49 @@ class CodeDeleteTool(Tool):
             file_path = project_dir / filename
             if not file_path.exists():
                 return f"File '{filename}' not found in {project}"
-            file_path.unlink()
+            await asyncio.to_thread(file_path.unlink)
             return f"Deleted {filename} from {project}"
         else:
-            shutil.rmtree(project_dir)
+            # rmtree walks the whole project; keep it off the event loop
+            await _run_fs(shutil.rmtree, project_dir)
+            _ensured_dirs.discard(project_dir)
             return f"Deleted project '{project}'"
 
 
 class ZigBuildTool(Tool):
     """Build a Zig project."""
 
-    @property
-    def name(self) -> str:
-        return "zig_build"
+    name = "zig_build"
 
-    @property
-    def description(self) -> str:
-        return (
-            "Build a Zig project. Can create optimized release builds. "
-            "For single files, compiles to executable. "
-            "For projects with build.zig, runs 'zig build'."
-        )
+    description = (
+        "Build a Zig project. Can create optimized release builds. "
+        "For single files, compiles to executable. "
+        "For projects with build.zig, runs 'zig build'."
+    )
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name",
-                },
-                "filename": {
-                    "type": "string",
-                    "description": "Main .zig file (optional if build.zig exists)",
-                },
-                "release": {
-                    "type": "boolean",
-                    "description": "Build optimized release (default false)",
-                    "default": False,
-                },
-                "output": {
-                    "type": "string",
-                    "description": "Output executable name (optional)",
-                },
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name",
+            },
+            "filename": {
+                "type": "string",
+                "description": "Main .zig file (optional if build.zig exists)",
+            },
+            "release": {
+                "type": "boolean",
+                "description": "Build optimized release (default false)",
+                "default": False,
             },
-            "required": ["project"],
-        }
+            "output": {
+                "type": "string",
+                "description": "Output executable name (optional)",
+            },
+        },
+        "required": ["project"],
+    }
 
     async def execute(
         self,
@@ -427,7 +632,7 @@ class ZigBuildTool(Tool):
         project_dir = get_project_dir(project)
 
         # Check if zig is available
-        zig_path = shutil.which("zig")
+        zig_path = _zig_path()
         if not zig_path:
             return "Error: Zig compiler not found. Please install Zig."
 
@@ -471,35 +676,29 @@ class ZigBuildTool(Tool):
 class ZigTestTool(Tool):
     """Run Zig tests."""
 
-    @property
-    def name(self) -> str:
-        return "zig_test"
-
-    @property
-    def description(self) -> str:
-        return "Run Zig tests in a file or project."
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name",
-                },
-                "filename": {
-                    "type": "string",
-                    "description": ".zig file with tests (optional if build.zig exists)",
-                },
+    name = "zig_test"
+
+    description = "Run Zig tests in a file or project."
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name",
+            },
+            "filename": {
+                "type": "string",
+                "description": ".zig file with tests (optional if build.zig exists)",
             },
-            "required": ["project"],
-        }
+        },
+        "required": ["project"],
+    }
 
     async def execute(self, project: str, filename: str | None = None) -> str:
         project_dir = get_project_dir(project)
 
-        zig_path = shutil.which("zig")
+        zig_path = _zig_path()
         if not zig_path:
             return "Error: Zig compiler not found. Please install Zig."
 
@@ -534,30 +733,24 @@ class ZigTestTool(Tool):
 class PythonTestTool(Tool):
     """Run Python tests with pytest."""
 
-    @property
-    def name(self) -> str:
-        return "python_test"
-
-    @property
-    def description(self) -> str:
-        return "Run Python tests with pytest in a project."
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Project name",
-                },
-                "filename": {
-                    "type": "string",
-                    "description": "Specific test file (optional)",
-                },
+    name = "python_test"
+
+    description = "Run Python tests with pytest in a project."
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Project name",
+            },
+            "filename": {
+                "type": "string",
+                "description": "Specific test file (optional)",
             },
-            "required": ["project"],
-        }
+        },
+        "required": ["project"],
+    }
 
     async def execute(self, project: str, filename: str | None = None) -> str:
         import sys
@@ -25,6 +25,25 @@ def save_cron_jobs(jobs: list[dict]) -> None:
         json.dump(jobs, f, indent=2, default=str)
 
 
+# Set when a scheduling tool mutates the job store; lets the message
+# handlers reload the scheduler only when something actually changed
+_jobs_dirty = False
+
+
+def mark_jobs_dirty() -> None:
+    """Flag that the job store changed and schedules need reloading."""
+    global _jobs_dirty
+    _jobs_dirty = True
+
+
+def consume_jobs_dirty() -> bool:
+    """Return whether the job store changed since last check, and reset."""
+    global _jobs_dirty
+    was_dirty = _jobs_dirty
+    _jobs_dirty = False
+    return was_dirty
+
+
 class CronCreateTool(Tool):
     """Create a scheduled reminder/task."""
 
@@ -104,6 +123,7 @@ class CronCreateTool(Tool):
 
         jobs.append(job)
         save_cron_jobs(jobs)
+        mark_jobs_dirty()
 
         if delay_minutes:
             return f"Reminder set for {delay_minutes} minutes from now (id={job['id']}): {message}"
@@ -189,6 +209,7 @@ class CronDeleteTool(Tool):
             return f"No job found with id={job_id}"
 
         save_cron_jobs(jobs)
+        mark_jobs_dirty()
         return f"Deleted job id={job_id}"
 
 
@@ -215,4 +236,5 @@ class CronClearTool(Tool):
             return "No scheduled tasks to clear."
 
         save_cron_jobs([])
+        mark_jobs_dirty()
         return f"Cleared all {count} scheduled task(s)."
@@ -0,0 +1,53 @@
+"""Tests for the response cache."""
+
+from squidbot.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test exact-match LRU response caching."""
+
+    def test_miss_then_hit(self):
+        """Test that a stored response is returned for the same key."""
+        cache = ResponseCache()
+        key = cache.key_for(1, "hello")
+
+        assert cache.get(key) is None
+        cache.put(key, "Hi there!")
+        assert cache.get(key) == "Hi there!"
+
+    def test_key_depends_on_scope_and_history(self):
+        """Test that scope and history context produce distinct keys."""
+        cache = ResponseCache()
+        history = [{"role": "user", "content": "earlier"}]
+
+        base = cache.key_for(1, "hello")
+        assert cache.key_for(2, "hello") != base
+        assert cache.key_for(1, "hello", history) != base
+
+    def test_message_normalization(self):
+        """Test that whitespace and case do not change the key."""
+        cache = ResponseCache()
+        assert cache.key_for(1, "Hello  ") == cache.key_for(1, "  hello")
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = ResponseCache(ttl=0.0)
+        key = cache.key_for(1, "hello")
+        cache.put(key, "stale")
+        assert cache.get(key) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(maxsize=2)
+        key_a = cache.key_for(1, "a")
+        key_b = cache.key_for(1, "b")
+        key_c = cache.key_for(1, "c")
+
+        cache.put(key_a, "A")
+        cache.put(key_b, "B")
+        cache.get(key_a)  # refresh A
+        cache.put(key_c, "C")  # evicts B
+
+        assert cache.get(key_a) == "A"
+        assert cache.get(key_b) is None
+        assert cache.get(key_c) == "C"
@@ -169,6 +169,33 @@ class TestHookRunner:
         result2 = await runner.run_before_tool_call(event2, ctx)
         assert result2 is None
 
+    @pytest.mark.asyncio
+    async def test_match_filter_skips_handler(self):
+        """Test match filter keeps handlers off non-matching events."""
+        registry = HookRegistry()
+        runner = HookRunner(registry)
+        seen = []
+
+        async def handler(event, ctx):
+            seen.append(event.tool_name)
+
+        registry.register(
+            "filtered",
+            HookName.AFTER_TOOL_CALL,
+            handler,
+            match={"send_cro"},
+        )
+
+        ctx = HookContext(plugin_id="test")
+        await runner.run_after_tool_call(
+            AfterToolCallEvent(tool_name="web_search", params={}), ctx
+        )
+        await runner.run_after_tool_call(
+            AfterToolCallEvent(tool_name="send_cro", params={}), ctx
+        )
+
+        assert seen == ["send_cro"]
+
     @pytest.mark.asyncio
     async def test_message_sending_modify(self):
         """Test message_sending can modify content."""
@@ -118,11 +118,10 @@ class TestScheduler:
         assert "Failed" in call_args
 
     @pytest.mark.asyncio
-    async def test_check_one_time_jobs_triggers_due_jobs(
+    async def test_run_one_time_job_triggers(
         self, scheduler, mock_send_message, mock_run_agent
     ):
-        """Test that due one-time jobs are triggered."""
-        # Create a job that's already due
+        """Test that one-time jobs execute and get disabled."""
         past_time = datetime.now() - timedelta(minutes=1)
         jobs = [
             {
@@ -135,7 +134,7 @@ class TestScheduler:
         ]
         save_cron_jobs(jobs)
 
-        await scheduler._check_one_time_jobs()
+        await scheduler._run_one_time_job(scheduler._get_jobs()[0])
 
         # Verify agent was called
         mock_run_agent.assert_called_once_with("Overdue reminder")
@@ -148,10 +147,10 @@ class TestScheduler:
         assert loaded[0]["enabled"] is False
 
     @pytest.mark.asyncio
-    async def test_check_one_time_jobs_skips_future_jobs(
+    async def test_load_schedules_future_jobs_without_running(
         self, scheduler, mock_send_message, mock_run_agent
     ):
-        """Test that future jobs are not triggered."""
+        """Test that future jobs are scheduled but not triggered."""
         future_time = datetime.now() + timedelta(hours=1)
         jobs = [
             {
@@ -164,7 +163,10 @@ class TestScheduler:
         ]
         save_cron_jobs(jobs)
 
-        await scheduler._check_one_time_jobs()
+        scheduler._load_cron_jobs()
+
+        # The job gets its own date trigger
+        assert scheduler.scheduler.get_job("one_time_1") is not None
 
         # Agent should not be called
         mock_run_agent.assert_not_called()
@@ -174,10 +176,10 @@ class TestScheduler:
         assert loaded[0]["enabled"] is True
 
     @pytest.mark.asyncio
-    async def test_check_one_time_jobs_skips_disabled_jobs(
+    async def test_load_skips_disabled_jobs(
         self, scheduler, mock_send_message, mock_run_agent
     ):
-        """Test that disabled jobs are not triggered."""
+        """Test that disabled jobs are never scheduled."""
         past_time = datetime.now() - timedelta(minutes=1)
         jobs = [
             {
@@ -190,8 +192,9 @@ class TestScheduler:
         ]
         save_cron_jobs(jobs)
 
-        await scheduler._check_one_time_jobs()
+        scheduler._load_cron_jobs()
 
+        assert scheduler.scheduler.get_job("one_time_1") is None
         mock_run_agent.assert_not_called()
 
 
@@ -237,28 +237,41 @@ class TestSchedulerHeartbeat:
         run_agent.assert_called_once()
         send_message.assert_called_once_with("You have a reminder!")
 
+    @pytest.mark.asyncio
+    async def test_heartbeat_skips_when_idle(self):
+        """Test heartbeat skips the agent after long user inactivity."""
+        run_agent = AsyncMock()
+
+        scheduler = Scheduler(
+            send_message=AsyncMock(),
+            run_agent=run_agent,
+            chat_id=12345,
+        )
+        scheduler._last_activity_ts = 0.0
+
+        await scheduler._heartbeat()
+
+        run_agent.assert_not_called()
+
 
 class TestSchedulerOneTimeJobs:
     """Test Scheduler one-time job checking."""
 
     @pytest.mark.asyncio
-    async def test_check_one_time_job_due(self):
-        """Test checking a one-time job that is due."""
-        past_time = (datetime.now() - timedelta(minutes=5)).isoformat()
-        mock_jobs = [
-            {
-                "id": 1,
-                "type": "one_time",
-                "trigger_at": past_time,
-                "message": "Reminder!",
-                "enabled": True,
-            }
-        ]
+    async def test_run_one_time_job(self):
+        """Test running a one-time job executes, disables, and persists."""
+        job = {
+            "id": 1,
+            "type": "one_time",
+            "trigger_at": datetime.now().isoformat(),
+            "message": "Reminder!",
+            "enabled": True,
+        }
 
         send_message = AsyncMock()
         run_agent = AsyncMock(return_value="Reminder executed")
 
-        with patch("squidbot.scheduler.load_cron_jobs", return_value=mock_jobs), patch(
+        with patch("squidbot.scheduler.load_cron_jobs", return_value=[job]), patch(
             "squidbot.scheduler.save_cron_jobs"
         ) as mock_save:
             scheduler = Scheduler(
@@ -266,15 +279,15 @@ class TestSchedulerOneTimeJobs:
                 run_agent=run_agent,
             )
 
-            await scheduler._check_one_time_jobs()
+            await scheduler._run_one_time_job(job)
 
             run_agent.assert_called_once_with("Reminder!")
             send_message.assert_called_once()
             mock_save.assert_called_once()
+            assert job["enabled"] is False
 
-    @pytest.mark.asyncio
-    async def test_check_one_time_job_not_due(self):
-        """Test checking a one-time job that is not due yet."""
+    def test_load_schedules_one_time_job(self):
+        """Test a pending one-time job gets its own date trigger."""
         future_time = (datetime.now() + timedelta(minutes=10)).isoformat()
         mock_jobs = [
             {
@@ -286,42 +299,37 @@ class TestSchedulerOneTimeJobs:
             }
         ]
 
-        run_agent = AsyncMock()
-
         with patch("squidbot.scheduler.load_cron_jobs", return_value=mock_jobs):
             scheduler = Scheduler(
                 send_message=AsyncMock(),
-                run_agent=run_agent,
+                run_agent=AsyncMock(),
             )
 
-            await scheduler._check_one_time_jobs()
+            scheduler._load_cron_jobs()
 
-            # Should not be executed yet
-            run_agent.assert_not_called()
+            assert scheduler.scheduler.get_job("one_time_1") is not None
 
 
 class TestSchedulerIntervalJobs:
     """Test Scheduler interval job checking."""
 
     @pytest.mark.asyncio
-    async def test_check_interval_job_due(self):
-        """Test checking an interval job that is due."""
+    async def test_run_interval_job(self):
+        """Test running an interval job executes and persists next trigger."""
         past_time = (datetime.now() - timedelta(seconds=10)).isoformat()
-        mock_jobs = [
-            {
-                "id": 1,
-                "type": "interval",
-                "next_trigger": past_time,
-                "interval_seconds": 60,
-                "message": "Interval task",
-                "enabled": True,
-            }
-        ]
+        job = {
+            "id": 1,
+            "type": "interval",
+            "next_trigger": past_time,
+            "interval_seconds": 60,
+            "message": "Interval task",
+            "enabled": True,
+        }
 
         send_message = AsyncMock()
         run_agent = AsyncMock(return_value="Interval executed")
 
-        with patch("squidbot.scheduler.load_cron_jobs", return_value=mock_jobs), patch(
+        with patch("squidbot.scheduler.load_cron_jobs", return_value=[job]), patch(
             "squidbot.scheduler.save_cron_jobs"
         ) as mock_save:
             scheduler = Scheduler(
@@ -329,15 +337,15 @@ class TestSchedulerIntervalJobs:
                 run_agent=run_agent,
             )
 
-            await scheduler._check_interval_jobs()
+            await scheduler._run_interval_job(job)
 
             run_agent.assert_called_once_with("Interval task")
             send_message.assert_called_once()
             mock_save.assert_called_once()
+            assert job["next_trigger"] > past_time
 
-    @pytest.mark.asyncio
-    async def test_check_interval_job_disabled(self):
-        """Test that disabled interval jobs are skipped."""
+    def test_load_skips_disabled_interval_job(self):
+        """Test that disabled interval jobs are never scheduled."""
         past_time = (datetime.now() - timedelta(seconds=10)).isoformat()
         mock_jobs = [
             {
@@ -350,14 +358,12 @@ class TestSchedulerIntervalJobs:
             }
         ]
 
-        run_agent = AsyncMock()
-
         with patch("squidbot.scheduler.load_cron_jobs", return_value=mock_jobs):
             scheduler = Scheduler(
                 send_message=AsyncMock(),
-                run_agent=run_agent,
+                run_agent=AsyncMock(),
             )
 
-            await scheduler._check_interval_jobs()
+            scheduler._load_cron_jobs()
 
-            run_agent.assert_not_called()
+            assert scheduler.scheduler.get_job("interval_1") is None
@@ -128,6 +128,35 @@ class TestSessionTranscript:
         assert messages[0]["content"] == "Hello"
         assert messages[1]["role"] == "assistant"
 
+    def test_append_messages_bulk(self, temp_transcript):
+        """Test bulk message append."""
+        temp_transcript.append_messages([("user", "Hello"), ("assistant", "Hi!")])
+
+        messages = list(temp_transcript.read_messages())
+        assert len(messages) == 2
+        assert messages[0]["role"] == "user"
+        assert messages[1]["content"] == "Hi!"
+
+    def test_rotate_compresses_old_segment(self, temp_transcript):
+        """Test that rotation gzips the old file and preserves history."""
+        temp_transcript.append_message("user", "Before rotation")
+        temp_transcript.rotate()
+        temp_transcript.append_message("assistant", "After rotation")
+
+        segments = list(
+            temp_transcript.file_path.parent.glob("test_session.jsonl.*")
+        )
+        assert len(segments) == 1
+        assert segments[0].suffix == ".gz"
+
+        messages = list(temp_transcript.read_messages())
+        assert [m["content"] for m in messages] == [
+            "Before rotation",
+            "After rotation",
+        ]
+        history = temp_transcript.get_history()
+        assert len(history) == 2
+
     def test_append_user_message(self, temp_transcript):
         """Test append_user_message helper."""
         temp_transcript.append_user_message("Test message")
@@ -242,6 +271,13 @@ class TestSession:
         assert len(history) == 2
         assert history[0]["role"] == "user"
 
+    def test_add_messages_bulk(self, temp_session):
+        """Test adding messages in bulk."""
+        temp_session.add_messages([("user", "Hello"), ("assistant", "Hi!")])
+
+        assert len(temp_session.history) == 2
+        assert temp_session.entry.message_count == 2
+
     def test_clear_history(self, temp_session):
         """Test clearing history."""
         temp_session.add_message("user", "Hello")
@@ -306,15 +342,48 @@ class TestSessionManager:
         assert transcript_path.suffix == ".jsonl"
 
     def test_creates_index_file(self, temp_store):
-        """Test that manager creates sessions.json index."""
+        """Test that manager creates the sessions.jsonl index."""
         manager = SessionManager(temp_store)
         manager.get(ChannelType.TELEGRAM, "1")
 
-        index_file = temp_store / "sessions.json"
+        index_file = temp_store / "sessions.jsonl"
         assert index_file.exists()
 
-        data = json.loads(index_file.read_text())
-        assert "telegram:1" in data
+        keys = set()
+        with open(index_file) as f:
+            for line in f:
+                record = json.loads(line)
+                keys.add(record.get("session_key"))
+        assert "telegram:1" in keys
+
+    def test_migrates_legacy_index(self, temp_store):
+        """Test one-time migration from the old sessions.json format."""
+        manager = SessionManager(temp_store)
+        session = manager.get(ChannelType.TELEGRAM, "42")
+
+        # Recreate the legacy full-index format
+        legacy = temp_store / "sessions.json"
+        legacy.write_text(
+            json.dumps({session.session_key: session.entry.to_dict()})
+        )
+        (temp_store / "sessions.jsonl").unlink()
+
+        manager2 = SessionManager(temp_store)
+        restored = manager2.get(ChannelType.TELEGRAM, "42", create_if_missing=False)
+        assert restored is not None
+        assert not legacy.exists()
+        assert (temp_store / "sessions.jsonl").exists()
+
+    def test_close_stops_flusher(self, temp_store):
+        """Test that close() flushes transcripts and stops the flusher."""
+        manager = SessionManager(temp_store)
+        session = manager.get(ChannelType.TCP, "client-1")
+        session.add_message("user", "Hello")
+        manager.close()
+
+        assert not manager._flusher.is_alive()
+        transcript_path = temp_store / session.entry.transcript_file
+        assert transcript_path.exists()
 
     def test_update_session(self, temp_store):
         """Test updating sessions."""
@@ -476,3 +476,73 @@ class TestLiveNetwork:
         print(f"Live wallet info: {result}")
         assert result["success"] is True
         assert result["connected"] is True
+
+
+class TestRpcBatcher:
+    """Test the JSON-RPC microbatching layer."""
+
+    def test_single_request_sent_as_object(self):
+        """Test a lone request is posted as a plain JSON-RPC object."""
+        from squidbot.plugins.web3_plugin import _RpcBatcher
+
+        posts = []
+
+        def fake_post(payload):
+            posts.append(payload)
+            return {"jsonrpc": "2.0", "id": payload["id"], "result": "0x5"}
+
+        batcher = _RpcBatcher("http://test", window=0.0, post=fake_post)
+        response = batcher.call("eth_blockNumber", [])
+
+        assert len(posts) == 1
+        assert isinstance(posts[0], dict)
+        assert response["result"] == "0x5"
+
+    def test_concurrent_requests_share_one_post(self):
+        """Test concurrent requests coalesce into one batched POST."""
+        import threading
+
+        from squidbot.plugins.web3_plugin import _RpcBatcher
+
+        posts = []
+
+        def fake_post(payload):
+            posts.append(payload)
+            return [
+                {"jsonrpc": "2.0", "id": r["id"], "result": f"r{r['id']}"}
+                for r in payload
+            ]
+
+        batcher = _RpcBatcher("http://test", window=0.05, post=fake_post)
+        results = {}
+
+        def worker(method):
+            results[method] = batcher.call(method, [])
+
+        threads = [
+            threading.Thread(target=worker, args=(m,))
+            for m in ("eth_getBalance", "eth_getTransactionCount")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(posts) == 1
+        assert isinstance(posts[0], list)
+        assert len(posts[0]) == 2
+        assert results["eth_getBalance"]["result"].startswith("r")
+        assert results["eth_getTransactionCount"]["result"].startswith("r")
+
+    def test_transport_failure_resolves_all_with_error(self):
+        """Test a failed POST surfaces as a JSON-RPC error response."""
+        from squidbot.plugins.web3_plugin import _RpcBatcher
+
+        def failing_post(payload):
+            raise ConnectionError("boom")
+
+        batcher = _RpcBatcher("http://test", window=0.0, post=failing_post)
+        response = batcher.call("eth_blockNumber", [])
+
+        assert "error" in response
+        assert "boom" in response["error"]["message"]